@@ -0,0 +1,130 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_TIMEOUT = 300
+USER_TOKEN_CACHE_TIMEOUT = 3600
+# User columns kept in the token cache, in model field order as `Model.from_db`
+# expects; the password hash is never cached
+CACHED_USER_FIELDS = ('id', 'is_superuser', 'username', 'is_staff', 'is_active')
+
+
+def token_cache_key(key):
+    """
+    Build the cache key under which an authenticated token's user is stored.
+
+    Args:
+        key (str): The token key sent by the client.
+
+    Returns:
+        str: The cache key for the token.
+    """
+    return f"tok:{key}"
+
+
+def user_token_cache_key(user_id):
+    """
+    Build the cache key under which a user's token key is stored.
+
+    Args:
+        user_id (int): Primary key of the user.
+
+    Returns:
+        str: The cache key for the user's token.
+    """
+    return f"user_tok:{user_id}"
+
+
+def user_exists_cache_key(username):
+    """
+    Build the cache key under which the existence of a username is stored.
+
+    Args:
+        username (str): The username to look up.
+
+    Returns:
+        str: The cache key for the username.
+    """
+    return f"uexist:{username}"
+
+
+def client_ip(request):
+    """
+    Return the address of the client that sent a request.
+
+    When `settings.CLIENT_IP_HEADER` names a header set by a trusted reverse
+    proxy, the last address in it (the one the proxy appended) is used, since
+    REMOTE_ADDR is then the proxy itself. Otherwise REMOTE_ADDR is used.
+
+    Args:
+        request (HttpRequest): The incoming request.
+
+    Returns:
+        str | None: The client address, if known.
+    """
+    if settings.CLIENT_IP_HEADER:
+        forwarded = request.META.get(settings.CLIENT_IP_HEADER, '')
+        address = forwarded.rsplit(',', 1)[-1].strip()
+        if address:
+            return address
+    return request.META.get('REMOTE_ADDR')
+
+
+def login_failures_cache_key(username, address):
+    """
+    Build the cache key counting recent failed logins for a username from one client.
+
+    Keying on the client address as well keeps other clients from locking
+    the account out. Behind a reverse proxy this needs `CLIENT_IP_HEADER` to
+    be set, or every client shares the proxy's address.
+
+    Args:
+        username (str): The username being logged in to.
+        address (str): Address of the client attempting the login.
+
+    Returns:
+        str: The cache key for the failure counter.
+    """
+    return f"fail:{username}:{address}"
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication backed by the Django cache.
+
+    The user resolved for a token key is memoized for a short time, so repeated
+    requests with the same token skip the Token and User SELECTs. Only the
+    columns in `CACHED_USER_FIELDS` are cached; the user is rebuilt from them
+    with every other column deferred. Entries are
+    invalidated by the signals in `main_app.api.authentication.signals` whenever
+    the token or its user changes.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Resolve the user for a token key, using the cache when possible.
+
+        Args:
+            key (str): The token key sent in the Authorization header.
+
+        Raises:
+            AuthenticationFailed: If the token does not exist or the user is inactive.
+
+        Returns:
+            tuple: The authenticated user and its token.
+        """
+        cache_key = token_cache_key(key)
+        values = cache.get(cache_key)
+        if values is not None:
+            user = User.from_db(None, CACHED_USER_FIELDS, values)
+            return user, Token(key=key, user=user)
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(
+            cache_key,
+            tuple(getattr(user, field) for field in CACHED_USER_FIELDS),
+            timeout=TOKEN_CACHE_TIMEOUT
+        )
+        return user, token
@@ -7,13 +7,28 @@ class Profile(models.Model):
     Represents additional user information linked to the built-in Django User model.
 
     Each user has a single Profile object that stores personal and professional
-    details such as full name, company, team, and position.
+    details such as full name, company, team, and position, along with the time
+    it was last updated.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     name = models.CharField(max_length=100, blank=True, help_text="Full name")
     company = models.CharField(max_length=100, blank=True, help_text="Company's name")
     team = models.CharField(max_length=100, blank=True, help_text="Team name")
     position = models.CharField(max_length=100, blank=True, help_text="Job title or role")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
+
+    @staticmethod
+    def mtime_cache_key(user_id):
+        """
+        Build the cache key holding the last modification time of a user's profile.
+
+        Args:
+            user_id (int): Primary key of the profile's user.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"pf_mtime_{user_id}"
@@ -1,9 +1,11 @@
 from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework import serializers
+from main_app.api.serializers import CachedFieldsMixin
 from main_app.api.authentication.models import Profile
 
 
-class UserRegisterSerializer(serializers.ModelSerializer):
+class UserRegisterSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for registering a new user.
 
@@ -18,7 +20,10 @@ class UserRegisterSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """
-        Create a new user instance with the given validated data.
+        Create a new user instance and its Profile with the given validated data.
+
+        The Profile is created explicitly in the same transaction, and the
+        `post_save` profile signal is skipped for this user.
 
         Args:
             validated_data (dict): Dictionary containing username, email, and password.
@@ -26,14 +31,18 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         Returns:
             User: A newly created User instance.
         """
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data.get('email'),
-            password=validated_data['password']
+        user = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data.get('email')),
         )
+        user.set_password(validated_data['password'])
+        user._skip_profile = True
+        with transaction.atomic():
+            user.save()
+            Profile.objects.create(user=user)
         return user
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for user login.
 
@@ -43,7 +52,7 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True)
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Profile model.
 
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+from main_app.api.authentication.authentication import (
+    token_cache_key,
+    user_exists_cache_key,
+    user_token_cache_key
+)
+from main_app.api.authentication.models import Profile
+
+HASHING_WORKERS = 4
+
+
+def bulk_create_users(users_data):
+    """
+    Create many users, each with an empty Profile, in a constant number of queries.
+
+    Passwords are hashed in a thread pool: the configured hasher (PBKDF2 by
+    default) releases the GIL while hashing, so the work spreads across cores.
+    `bulk_create` does not send `post_save`, so profiles are created here
+    explicitly with a single `Profile.objects.bulk_create` call, and cached
+    username existence checks are cleared in one call.
+
+    Args:
+        users_data (list[dict]): Dictionaries with username, email, and password.
+
+    Returns:
+        list[User]: The newly created User instances.
+    """
+    with ThreadPoolExecutor(max_workers=HASHING_WORKERS) as executor:
+        hashed = list(executor.map(make_password, [data['password'] for data in users_data]))
+
+    users = [
+        User(
+            username=User.normalize_username(data['username']),
+            email=User.objects.normalize_email(data.get('email')),
+            password=password,
+        )
+        for data, password in zip(users_data, hashed)
+    ]
+    with transaction.atomic():
+        users = User.objects.bulk_create(users)
+        Profile.objects.bulk_create([Profile(user=user) for user in users])
+
+    cache.delete_many([user_exists_cache_key(user.username) for user in users])
+    return users
+
+
+def deactivate_users(queryset):
+    """
+    Deactivate the given users and evict their cached token lookups.
+
+    `QuerySet.update` does not send `post_save`, so the cache entries of every
+    affected token are removed here with a single `delete_many` call.
+
+    Args:
+        queryset (QuerySet): The users to deactivate.
+
+    Returns:
+        int: The number of users deactivated.
+    """
+    user_ids = list(queryset.filter(is_active=True).values_list('id', flat=True))
+    if not user_ids:
+        return 0
+
+    with transaction.atomic():
+        updated = User.objects.filter(id__in=user_ids).update(is_active=False)
+        tokens = Token.objects.filter(user_id__in=user_ids).values_list('key', 'user_id')
+        keys = []
+        for key, user_id in tokens:
+            keys.append(token_cache_key(key))
+            keys.append(user_token_cache_key(user_id))
+
+    cache.delete_many(keys)
+    return updated
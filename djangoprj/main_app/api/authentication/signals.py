@@ -1,13 +1,23 @@
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
 from main_app.api.authentication.models import Profile
+from main_app.api.authentication.authentication import (
+    token_cache_key,
+    user_exists_cache_key,
+    user_token_cache_key
+)
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """
     Signal handler that creates a Profile whenever a new User is created.
 
+    Users flagged with `_skip_profile` (e.g. from `UserRegisterSerializer`)
+    get their Profile created explicitly by the caller instead.
+
     Args:
         sender (Model): The model class (User) that triggered the signal.
         instance (User): The actual User instance being saved.
@@ -17,5 +27,81 @@ def create_user_profile(sender, instance, created, **kwargs):
     Returns:
         None
     """
-    if created:
+    if created and not getattr(instance, '_skip_profile', False):
         Profile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, **kwargs):
+    """
+    Signal handler that drops cached token lookups when a User is updated.
+
+    Cached entries hold a copy of the user, so any change (e.g. deactivation)
+    must evict them before the next authenticated request.
+
+    Args:
+        sender (Model): The model class (User) that triggered the signal.
+        instance (User): The User instance being saved.
+        created (bool): Whether this instance was created (True) or updated (False).
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    if created:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_exists(sender, instance, **kwargs):
+    """
+    Signal handler that drops the cached existence check of a saved User's username.
+
+    Without this, a username cached as unknown by `LoginView` would keep being
+    rejected for a while after the account is registered.
+
+    Args:
+        sender (Model): The model class (User) that triggered the signal.
+        instance (User): The User instance being saved.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    cache.delete(user_exists_cache_key(instance.username))
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """
+    Signal handler that drops the cached lookups of a saved or deleted Token,
+    both by key and by user.
+
+    Args:
+        sender (Model): The model class (Token) that triggered the signal.
+        instance (Token): The Token instance being saved or deleted.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    cache.delete_many([token_cache_key(instance.key), user_token_cache_key(instance.user_id)])
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_mtime(sender, instance, **kwargs):
+    """
+    Signal handler that drops the cached modification time of a saved Profile.
+
+    Args:
+        sender (Model): The model class (Profile) that triggered the signal.
+        instance (Profile): The Profile instance being saved.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    cache.delete(Profile.mtime_cache_key(instance.user_id))
@@ -7,12 +7,14 @@ Authentication URL patterns.
 
 This module defines the endpoints for user authentication and profile handling:
 - /register/ : Register a new user account.
+- /register/bulk/ : Register many user accounts at once (staff only).
 - /login/    : Authenticate an existing user.
 - /profile/  : Retrieve or update the profile information of the logged-in user.
 """
 
 AUTH_URLS = [
     path('register/', views.RegisterView.as_view(), name='register'),
+    path('register/bulk/', views.BulkRegisterView.as_view(), name='register-bulk'),
     path('login/', views.LoginView.as_view(), name='login'),
     path('profile/', views.ProfileView.as_view(), name='profile'),
 ]
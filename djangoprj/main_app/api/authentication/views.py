@@ -3,12 +3,76 @@ from rest_framework import generics, status, permissions
 from rest_framework.permissions import AllowAny
 from django.contrib.auth.models import User
 from rest_framework.authtoken.models import Token
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.views.decorators.http import condition
+from main_app.api.authentication.authentication import (
+    CachedTokenAuthentication,
+    USER_TOKEN_CACHE_TIMEOUT,
+    client_ip,
+    login_failures_cache_key,
+    user_exists_cache_key,
+    user_token_cache_key
+)
 from main_app.api.authentication.models import Profile
+from main_app.api.authentication.services import bulk_create_users
 from main_app.api.authentication.serializers import UserRegisterSerializer, LoginSerializer, ProfileSerializer
 
+PROFILE_MTIME_CACHE_TIMEOUT = 300
+
+USER_EXISTS_CACHE_TIMEOUT = 60
+LOGIN_MAX_FAILED_ATTEMPTS = 5
+LOGIN_FAILED_ATTEMPTS_WINDOW = 300
+
+# Columns loaded for ProfileSerializer; updated_at must stay loaded so that
+# saving a partially loaded profile still refreshes it.
+PROFILE_FIELDS = ('name', 'company', 'team', 'position', 'updated_at', 'user__id', 'user__email')
+
+
+def profile_last_modified(request, *args, **kwargs):
+    """
+    Return when the authenticated user's profile was last updated.
+
+    The value is cached and evicted whenever the profile is saved.
+
+    Args:
+        request (Request): The HTTP request object.
+        *args: Additional positional arguments.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        datetime | None: The profile's `updated_at`, or None if it has no profile.
+    """
+    return cache.get_or_set(
+        Profile.mtime_cache_key(request.user.id),
+        lambda: Profile.objects.filter(user=request.user).values_list('updated_at', flat=True).first(),
+        PROFILE_MTIME_CACHE_TIMEOUT
+    )
+
+
+def profile_etag(request, *args, **kwargs):
+    """
+    Build the ETag of the authenticated user's profile.
+
+    Args:
+        request (Request): The HTTP request object.
+        *args: Additional positional arguments.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        str | None: An ETag derived from the user ID and the profile's
+            modification time, or None if it has no profile.
+    """
+    last_modified = profile_last_modified(request)
+    if last_modified is None:
+        return None
+    return f"{request.user.id}:{last_modified.isoformat()}"
+
+
 class RegisterView(generics.CreateAPIView):
     """
     API endpoint for registering a new user.
@@ -20,13 +84,56 @@ class RegisterView(generics.CreateAPIView):
     serializer_class = UserRegisterSerializer
     permission_classes = [AllowAny]
 
+class BulkRegisterView(generics.GenericAPIView):
+    """
+    API endpoint for registering many users in a single request.
+
+    Restricted to staff users. Each item is validated with UserRegisterSerializer,
+    then all users and their profiles are created in one transaction.
+    """
+    serializer_class = UserRegisterSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle POST requests containing a list of users to register.
+
+        Args:
+            request (Request): The HTTP request containing a list of
+                username, email, and password objects.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Response:
+                - 201 Created with the created users (without passwords).
+                - 400 Bad Request with validation errors otherwise.
+        """
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        usernames = [item['username'] for item in serializer.validated_data]
+        if len(set(usernames)) != len(usernames):
+            return Response({"detail": "Duplicate usernames in request."}, status=status.HTTP_400_BAD_REQUEST)
+
+        users = bulk_create_users(serializer.validated_data)
+        return Response(
+            [{'id': user.id, 'username': user.username, 'email': user.email} for user in users],
+            status=status.HTTP_201_CREATED
+        )
+
 class LoginView(generics.GenericAPIView):
     """
     API endpoint for user login.
 
     This view allows users to authenticate with their username and password.
     If the credentials are valid, an authentication token is returned along with 
-    the user's ID and username.
+    the user's ID and username. The user's token key is cached, so repeat logins
+    skip the Token table lookup.
+
+    Unknown usernames skip the User lookup but still hash the password once, so
+    their response time matches a wrong password. Password hashing is skipped for
+    a username with too many recent failed attempts from the same client.
     """
     permission_classes = [AllowAny]
     serializer_class = LoginSerializer
@@ -44,20 +151,52 @@ class LoginView(generics.GenericAPIView):
             Response: 
                 - 200 OK with token, user_id, and username if authentication succeeds.
                 - 401 Unauthorized with an error message if credentials are invalid.
+                - 429 Too Many Requests if the username has too many recent
+                  failures from this client.
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        username = serializer.validated_data['username']
+        password = serializer.validated_data['password']
 
-        user = authenticate(
-            username=serializer.validated_data['username'],
-            password=serializer.validated_data['password']
+        failures_key = login_failures_cache_key(username, client_ip(request))
+        if cache.get(failures_key, 0) >= LOGIN_MAX_FAILED_ATTEMPTS:
+            return Response(
+                {"detail": "Too many failed login attempts. Try again later."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        exists = cache.get_or_set(
+            user_exists_cache_key(username),
+            lambda: User.objects.filter(username=username).exists(),
+            USER_EXISTS_CACHE_TIMEOUT
         )
+        if not exists:
+            # Same dummy hash ModelBackend runs for unknown users
+            User().set_password(password)
+            return Response({"detail": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        user = authenticate(username=username, password=password)
         if not user:
+            cache.add(failures_key, 0, timeout=LOGIN_FAILED_ATTEMPTS_WINDOW)
+            try:
+                cache.incr(failures_key)
+            except ValueError:
+                # The counter expired between add() and incr()
+                cache.set(failures_key, 1, timeout=LOGIN_FAILED_ATTEMPTS_WINDOW)
             return Response({"detail": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
-        token, created = Token.objects.get_or_create(user=user)
+        cache.delete(failures_key)
+
+        cache_key = user_token_cache_key(user.id)
+        key = cache.get(cache_key)
+        if key is None:
+            token, created = Token.objects.get_or_create(user=user)
+            key = token.key
+            cache.set(cache_key, key, timeout=USER_TOKEN_CACHE_TIMEOUT)
+
         return Response({
-            'token': token.key,
+            'token': key,
             'user_id': user.id,
             'username': user.username
         })
@@ -68,50 +207,91 @@ class ProfileView(generics.GenericAPIView):
     API endpoint for retrieving and updating the authenticated user's profile.
 
     This view ensures that only the logged-in user can access and modify 
-    their own Profile instance. Authentication via token is required.
+    their own Profile instance. Authentication via token is required; token
+    lookups are served from the cache when possible.
     """
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get_queryset(self):
         """
         Define the queryset as the profile of the currently authenticated user.
 
+        The related user is joined in the same query, since the serializer reads
+        `user.email`, and only the columns the serializer needs are loaded, plus
+        `updated_at` so that saving the partially loaded profile refreshes it.
+
         Returns:
             QuerySet: A queryset containing the profile linked to the logged-in user.
         """
-        return Profile.objects.filter(user=self.request.user)
+        return (
+            Profile.objects
+            .select_related('user')
+            .only(*PROFILE_FIELDS)
+            .filter(user=self.request.user)
+        )
 
-    def get_object(self):
+    @cached_property
+    def _profile(self):
         """
-        Retrieve the single Profile object for the authenticated user.
+        The authenticated user's Profile, fetched once per request.
 
-        Unlike typical DRF behavior, this method does not rely on a 'pk'
-        in the URL but instead fetches the profile directly from the queryset.
+        Unlike typical DRF behavior, the lookup does not rely on a 'pk' in the
+        URL but fetches the only row of `get_queryset()`, an indexed lookup on
+        the user ID.
+
+        Raises:
+            Http404: If the user has no profile.
 
         Returns:
             Profile: The profile instance associated with the authenticated user.
         """
-        queryset = self.get_queryset()
-        obj = generics.get_object_or_404(queryset)
-        return obj
+        try:
+            return self.get_queryset().get()
+        except Profile.DoesNotExist:
+            raise Http404
+
+    def get_object(self):
+        """
+        Retrieve the single Profile object for the authenticated user.
+
+        Returns:
+            Profile: The cached profile instance for this request.
+        """
+        return self._profile
 
+    @method_decorator(condition(etag_func=profile_etag, last_modified_func=profile_last_modified))
     def get(self, request, *args, **kwargs):
         """
         Handle GET requests to fetch the user's profile data.
 
+        The profile is read as a plain dict with `values()`, skipping model
+        instantiation and the serializer; the output matches `ProfileSerializer`.
+        Responses carry ETag and Last-Modified headers, and conditional requests
+        for an unchanged profile get 304 Not Modified without querying it.
+
         Args:
             request (Request): The HTTP request object.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
+        Raises:
+            Http404: If the user has no profile.
+
         Returns:
             Response: JSON representation of the user's profile.
         """
-        profile = self.get_object()
-        serializer = self.get_serializer(profile)
-        return Response(serializer.data)
+        data = (
+            Profile.objects
+            .filter(user=request.user)
+            .values('name', 'company', 'team', 'position', 'user__email')
+            .first()
+        )
+        if data is None:
+            raise Http404
+        data['user_email'] = data.pop('user__email')
+        return Response(data)
 
     def patch(self, request, *args, **kwargs):
         """
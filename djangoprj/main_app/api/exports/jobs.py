@@ -0,0 +1,237 @@
+import hashlib
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import xlsxwriter
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from main_app.api.time_management.caching import summary_version_cache_key
+from main_app.api.time_management.models import Project
+from main_app.api.time_management.summaries import project_summary_rows
+
+EXPORT_JOB_TIMEOUT = 3600
+EXPORT_WORKERS = 2
+# Lifetime of signed download links, in seconds; export files not linked to
+# for that long are deleted
+DOWNLOAD_URL_MAX_AGE = 600
+
+_executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix='export')
+
+
+def exports_dir():
+    """
+    Return the directory where generated export files are stored.
+
+    Returns:
+        Path: `MEDIA_ROOT/exports`.
+    """
+    return Path(settings.MEDIA_ROOT) / 'exports'
+
+
+def export_job_cache_key(job_id):
+    """
+    Build the cache key holding the state of an export job.
+
+    Args:
+        job_id (str): The export job ID.
+
+    Returns:
+        str: The cache key for the job.
+    """
+    return f"export_job:{job_id}"
+
+
+def get_export_job(job_id):
+    """
+    Return the state of an export job.
+
+    Args:
+        job_id (str): The export job ID.
+
+    Returns:
+        dict | None: The job state (user_id, status, file_name, rows), or None
+            if the job is unknown or expired.
+    """
+    return cache.get(export_job_cache_key(job_id))
+
+
+def export_file_cache_key(file_name):
+    """
+    Build the cache key holding the row count of a generated export file.
+
+    Args:
+        file_name (str): Name of the file in the exports directory.
+
+    Returns:
+        str: The cache key for the file.
+    """
+    return f"export_file:{file_name}"
+
+
+def keep_export_file(file_name):
+    """
+    Push back the expiry of an export file, as a new download link is issued for it.
+
+    Args:
+        file_name (str): Name of the file in the exports directory.
+
+    Returns:
+        bool: False if the file no longer exists.
+    """
+    try:
+        os.utime(exports_dir() / file_name)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def purge_expired_exports():
+    """
+    Delete export files whose last download link has expired.
+
+    A file's modification time is refreshed by `keep_export_file` whenever a
+    link to it is issued, so files older than `DOWNLOAD_URL_MAX_AGE` can no
+    longer be downloaded.
+
+    Returns:
+        int: The number of files deleted.
+    """
+    cutoff = time.time() - DOWNLOAD_URL_MAX_AGE
+    deleted = 0
+    for path in exports_dir().glob('*'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                deleted += 1
+        except FileNotFoundError:
+            continue
+    return deleted
+
+
+def _export_file_name(user_id, start_date, end_date):
+    """
+    Name the export file of a user's summary for a date range.
+
+    The name includes the user's current summary version, so repeat requests
+    for unchanged data reuse the same file while any change produces a new one.
+
+    Args:
+        user_id (int): Primary key of the user.
+        start_date (date | None): Start of the date range, if any.
+        end_date (date | None): End of the date range, if any.
+
+    Returns:
+        str: The file name, relative to the exports directory.
+    """
+    version = cache.get_or_set(summary_version_cache_key(user_id), 1, timeout=None)
+    digest = hashlib.sha256(f"{user_id}:{version}:{start_date}:{end_date}".encode()).hexdigest()[:32]
+    return f"{digest}.xlsx"
+
+
+def write_project_summary_workbook(path, rows, start_date, end_date):
+    """
+    Write project summary rows to an Excel file in constant-memory mode.
+
+    Args:
+        path (Path): Destination file.
+        rows (Iterable[dict]): Summary rows with name and total_hours keys.
+        start_date (date | None): Start of the date range, if any.
+        end_date (date | None): End of the date range, if any.
+
+    Returns:
+        int: The number of project rows written.
+    """
+    if start_date and end_date:
+        sheet_name = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
+    else:
+        sheet_name = "All Time"
+
+    workbook = xlsxwriter.Workbook(str(path), {'constant_memory': True})
+    worksheet = workbook.add_worksheet(sheet_name)
+
+    header_format = workbook.add_format({'bold': True})
+    money_format = workbook.add_format({'num_format': '0.00'})
+    worksheet.set_column(1, 1, 12, money_format)
+
+    worksheet.write_row(0, 0, ('Project', 'Total Hours'), header_format)
+    total_sum = 0.0
+    count = 0
+    for count, row in enumerate(rows, start=1):
+        hours = float(row['total_hours'])
+        total_sum += hours
+        worksheet.write_row(count, 0, (row['name'], hours))
+
+    worksheet.write_row(count + 1, 0, ("Total", total_sum))
+    workbook.close()
+    return count
+
+
+def _run_export_job(job_id, user_id, start_date, end_date, file_name):
+    """
+    Build the export file of a job and record the outcome in its state.
+
+    Args:
+        job_id (str): The export job ID.
+        user_id (int): Primary key of the user requesting the export.
+        start_date (date | None): Start of the date range, if any.
+        end_date (date | None): End of the date range, if any.
+        file_name (str): Name of the file to write in the exports directory.
+
+    Returns:
+        None
+    """
+    key = export_job_cache_key(job_id)
+    job = {'user_id': user_id, 'status': 'pending', 'file_name': file_name, 'rows': 0}
+    try:
+        directory = exports_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        rows = project_summary_rows(
+            Project.objects.only('id', 'name').filter(owner_id=user_id), start_date, end_date
+        )
+
+        tmp_path = directory / f"{file_name}.{job_id}.tmp"
+        job['rows'] = write_project_summary_workbook(tmp_path, rows.iterator(), start_date, end_date)
+        tmp_path.replace(directory / file_name)
+        job['status'] = 'done'
+        cache.set(export_file_cache_key(file_name), job['rows'], EXPORT_JOB_TIMEOUT)
+    except Exception:
+        job['status'] = 'failed'
+        raise
+    finally:
+        cache.set(key, job, EXPORT_JOB_TIMEOUT)
+        close_old_connections()
+
+
+def start_project_summary_export(user_id, start_date=None, end_date=None):
+    """
+    Start (or reuse) an export of a user's project summary.
+
+    If the file for the same user, date range, and data version already exists,
+    the job is completed immediately; otherwise it is built in a background thread.
+    Expired export files are purged in the background as well.
+
+    Args:
+        user_id (int): Primary key of the user requesting the export.
+        start_date (date | None): Start of the date range, if any.
+        end_date (date | None): End of the date range, if any.
+
+    Returns:
+        str: The export job ID.
+    """
+    job_id = uuid.uuid4().hex
+    file_name = _export_file_name(user_id, start_date, end_date)
+    key = export_job_cache_key(job_id)
+
+    _executor.submit(purge_expired_exports)
+
+    existing = cache.get(export_file_cache_key(file_name))
+    if existing is not None and keep_export_file(file_name):
+        cache.set(key, {'user_id': user_id, 'status': 'done', 'file_name': file_name, 'rows': existing}, EXPORT_JOB_TIMEOUT)
+        return job_id
+
+    cache.set(key, {'user_id': user_id, 'status': 'pending', 'file_name': file_name, 'rows': 0}, EXPORT_JOB_TIMEOUT)
+    _executor.submit(_run_export_job, job_id, user_id, start_date, end_date, file_name)
+    return job_id
@@ -0,0 +1,17 @@
+from django.urls import path
+from main_app.api.exports import views
+
+"""
+URL patterns for file exports.
+
+Endpoints:
+- /projects/           : Start an Excel export of the project summary.
+- /<job_id>/           : Poll an export job and get its signed download URL.
+- /download/<token>/   : Download a finished export from a signed URL.
+"""
+
+EXPORT_URLS = [
+    path('projects/', views.ProjectSummaryExportView.as_view(), name='export-project-summary'),
+    path('<str:job_id>/', views.ExportJobView.as_view(), name='export-job'),
+    path('download/<str:token>/', views.ExportDownloadView.as_view(), name='export-download'),
+]
@@ -0,0 +1,132 @@
+from datetime import date
+from django.core import signing
+from django.http import FileResponse, Http404
+from django.urls import reverse
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from main_app.api.authentication.authentication import CachedTokenAuthentication
+from main_app.api.exports.jobs import (
+    DOWNLOAD_URL_MAX_AGE,
+    exports_dir,
+    get_export_job,
+    keep_export_file,
+    start_project_summary_export
+)
+
+DOWNLOAD_URL_SALT = 'exports.download'
+
+
+class ProjectSummaryExportView(APIView):
+    """
+    API endpoint for starting an Excel export of the project summary.
+
+    The workbook is built in a background job; the response only carries the
+    job ID, which is polled through `ExportJobView`.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        """
+        Handle POST requests to start an export.
+
+        Args:
+            request (Request): The HTTP request. May include optional
+                `start_date` and `end_date` (YYYY-MM-DD).
+
+        Returns:
+            Response: 202 Accepted with the job ID, or 400 Bad Request if the
+                dates are invalid.
+        """
+        start_date = request.data.get('start_date')
+        end_date = request.data.get('end_date')
+        if start_date and end_date:
+            try:
+                start_date = date.fromisoformat(start_date)
+                end_date = date.fromisoformat(end_date)
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "Dates must use the YYYY-MM-DD format."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            start_date = end_date = None
+
+        job_id = start_project_summary_export(request.user.id, start_date, end_date)
+        return Response({"job_id": job_id}, status=status.HTTP_202_ACCEPTED)
+
+
+class ExportJobView(APIView):
+    """
+    API endpoint for polling an export job.
+
+    Once the job is done, the response includes a short-lived signed URL
+    from which the file can be downloaded without a token. Issuing the URL
+    keeps the file from expiring before the URL does.
+    """
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, job_id):
+        """
+        Handle GET requests to retrieve the status of an export job.
+
+        Args:
+            request (Request): The HTTP request object.
+            job_id (str): The export job ID.
+
+        Returns:
+            Response: The job status, row count and, when done, the download URL.
+                The status is 'expired' if the file was already deleted.
+        """
+        job = get_export_job(job_id)
+        if job is None or job['user_id'] != request.user.id:
+            raise Http404
+
+        data = {"status": job['status'], "rows": job['rows']}
+        if job['status'] == 'done' and not keep_export_file(job['file_name']):
+            data["status"] = 'expired'
+        elif job['status'] == 'done':
+            token = signing.dumps(job['file_name'], salt=DOWNLOAD_URL_SALT)
+            data["download_url"] = reverse('exports:export-download', kwargs={'token': token})
+        return Response(data)
+
+
+class ExportDownloadView(APIView):
+    """
+    Endpoint serving a generated export file from a signed URL.
+
+    The signature authorizes the download, so no token is required.
+    """
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, token):
+        """
+        Handle GET requests to download an export file.
+
+        Args:
+            request (Request): The HTTP request object.
+            token (str): Signed file name issued by `ExportJobView`.
+
+        Returns:
+            FileResponse: The Excel file as an attachment.
+
+        Raises:
+            Http404: If the signature is invalid or expired, or the file is missing.
+        """
+        try:
+            file_name = signing.loads(token, salt=DOWNLOAD_URL_SALT, max_age=DOWNLOAD_URL_MAX_AGE)
+        except signing.BadSignature:
+            raise Http404
+
+        path = exports_dir() / file_name
+        if not path.is_file():
+            raise Http404
+        return FileResponse(
+            path.open('rb'),
+            as_attachment=True,
+            filename='project_summary.xlsx',
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
@@ -0,0 +1,24 @@
+from rest_framework.metadata import SimpleMetadata
+
+
+class FastMetadata(SimpleMetadata):
+    """
+    Metadata class for OPTIONS requests that never enumerates field choices.
+
+    Listing choices can require evaluating a field's queryset, so `choices`
+    is dropped from every field description.
+    """
+
+    def get_field_info(self, field):
+        """
+        Describe a serializer field without its choices.
+
+        Args:
+            field (Field): The serializer field to describe.
+
+        Returns:
+            dict: Field information as built by SimpleMetadata, minus `choices`.
+        """
+        field_info = super().get_field_info(field)
+        field_info.pop('choices', None)
+        return field_info
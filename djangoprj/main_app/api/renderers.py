@@ -0,0 +1,64 @@
+import datetime
+import decimal
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+
+
+def orjson_default(obj):
+    """
+    Convert values orjson does not handle natively, as DRF's JSONEncoder does.
+
+    Args:
+        obj (Any): The value orjson could not serialize.
+
+    Raises:
+        TypeError: If the value has no JSON representation.
+
+    Returns:
+        Any: A JSON-serializable representation of `obj`.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes responses with orjson instead of the stdlib `json`.
+
+    Output matches DRF's JSONRenderer: Decimals are rendered as numbers, and
+    UTC datetimes use the 'Z' suffix.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON bytes.
+
+        Args:
+            data (Any): The response data.
+            accepted_media_type (str, optional): The negotiated media type.
+            renderer_context (dict, optional): Context from the view, which may
+                request indentation (e.g. from the browsable API).
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+        if data is None:
+            return b''
+
+        option = orjson.OPT_UTC_Z
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=orjson_default, option=option)
@@ -0,0 +1,26 @@
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Serializer mixin that builds the unbound fields once per serializer class.
+
+    `Serializer.get_fields()` deep-copies the declared fields and, for a
+    `ModelSerializer`, introspects the model to build the rest, on every
+    instantiation. The result only depends on the class, so it is computed once
+    and each instance receives a copy of the cached fields to bind.
+    """
+
+    def get_fields(self):
+        """
+        Return a fresh copy of the class-level cached fields.
+
+        Returns:
+            dict: Mapping of field names to unbound field instances.
+        """
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
@@ -0,0 +1,50 @@
+from django.core.cache import cache
+
+SUMMARY_CACHE_TIMEOUT = 30
+
+
+def summary_version_cache_key(owner_id):
+    """
+    Build the cache key holding the version of an owner's project summaries.
+
+    Args:
+        owner_id (int): Primary key of the projects' owner.
+
+    Returns:
+        str: The cache key for the version counter.
+    """
+    return f"psum_ver:{owner_id}"
+
+
+def summary_cache_key(owner_id, start_date, end_date):
+    """
+    Build the cache key of an owner's project summary for a date range.
+
+    The key embeds the owner's current summary version, so bumping the version
+    makes every cached summary of that owner unreachable at once.
+
+    Args:
+        owner_id (int): Primary key of the projects' owner.
+        start_date (str | None): Start of the date range, if any.
+        end_date (str | None): End of the date range, if any.
+
+    Returns:
+        str: The cache key for the summary.
+    """
+    version = cache.get_or_set(summary_version_cache_key(owner_id), 1, timeout=None)
+    return f"psum:{owner_id}:{version}:{start_date}:{end_date}"
+
+
+def bump_summary_version(owner_id):
+    """
+    Invalidate all cached project summaries of an owner.
+
+    Args:
+        owner_id (int): Primary key of the projects' owner.
+
+    Returns:
+        None
+    """
+    key = summary_version_cache_key(owner_id)
+    cache.add(key, 1, timeout=None)
+    cache.incr(key)
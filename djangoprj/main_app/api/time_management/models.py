@@ -10,10 +10,15 @@ class Project(models.Model):
         name (str): The name of the project.
         description (str): An optional description of the project.
         owner (User): The user who owns the project.
+        cached_total_hours (Decimal): Total hours of all the project's time
+            entries, kept up to date by the TimeEntry signals.
+        updated_at (datetime): When the project or its logged hours last changed.
     """
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True) 
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projects")
+    cached_total_hours = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -51,5 +56,35 @@ class TimeEntry(models.Model):
     comment = models.TextField(blank=True)
     date = models.DateField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'date'], name='te_task_date_idx'),
+            models.Index(fields=['user', 'date']),
+        ]
+
     def __str__(self):
         return f"{self.hours}h on {self.task.name} by {self.user.username}"
+
+class ProjectDailyHours(models.Model):
+    """
+    Total hours logged on a project for a single day.
+
+    Rows are maintained incrementally by the TimeEntry signals so that
+    date-ranged summaries sum a few daily buckets instead of every entry.
+
+    Attributes:
+        project (Project): The project the hours belong to.
+        date (date): The day the hours were logged on.
+        hours (Decimal): Sum of the hours of the project's time entries on that day.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="daily_hours")
+    date = models.DateField()
+    hours = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'date'], name='pdh_project_date_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.hours}h on {self.project.name} on {self.date}"
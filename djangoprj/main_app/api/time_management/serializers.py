@@ -1,23 +1,29 @@
-import re
 from rest_framework import serializers
 from decimal import Decimal
+from django.db.models import QuerySet
+from main_app.api.serializers import CachedFieldsMixin
 from main_app.api.time_management import models
 
+# Decimal hours for 0..59 minutes, rounded to the 2 places stored in TimeEntry.hours
+_MINUTE_HOURS = tuple((Decimal(minute) / 60).quantize(Decimal('0.01')) for minute in range(60))
 
-class ProjectSerializer(serializers.ModelSerializer):
+
+class ProjectSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Project model.
 
     Exposes project fields such as id, name, description, and owner.
-    The owner field is read-only and automatically set.
+    The owner field is read-only and automatically set; it is rendered from
+    `owner_id` as a plain integer rather than through a related field.
     """
+    owner = serializers.IntegerField(source='owner_id', read_only=True)
+
     class Meta:
         model = models.Project
         fields = ['id', 'name', 'description', 'owner']
-        read_only_fields = ['owner']
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Task model.
 
@@ -30,19 +36,33 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only_fields = ['project']
 
 
-class TimeEntrySerializer(serializers.ModelSerializer):
+class TaskWithTotalsSerializer(TaskSerializer):
+    """
+    Serializer for tasks annotated with their total tracked hours.
+
+    Adds a read-only `total_hours` field, expected as a `total_hours`
+    annotation on the queryset and rendered as a decimal string.
+    """
+    total_hours = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = TaskSerializer.Meta.fields + ['total_hours']
+
+
+class TimeEntrySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the TimeEntry model.
 
     Includes a custom 'duration' field for user input (e.g., "1h 30m"),
     which is converted into decimal hours and stored in the 'hours' field.
+    The task and user are not serializer fields; views pass them to `save()`.
     """
     duration = serializers.CharField(write_only=True)
 
     class Meta:
         model = models.TimeEntry
-        fields = ['id', 'task', 'user', 'comment', 'date', 'hours', 'duration']
-        read_only_fields = ['hours', 'task', 'user']
+        fields = ['id', 'comment', 'date', 'hours', 'duration']
+        read_only_fields = ['hours']
 
     def validate_duration(self, value):
         """
@@ -57,21 +77,30 @@ class TimeEntrySerializer(serializers.ModelSerializer):
         Returns:
             Decimal: The duration converted to decimal hours.
         """
-        value = value.strip().lower()
-        
-        hours = 0
-        minutes = 0
-
-        # Match hours (e.g., "12h")
-        hour_match = re.search(r'(\d+)\s*h', value)
-        if hour_match:
-            hours = int(hour_match.group(1))
-
-        minute_match = re.search(r'(\d+)\s*m', value)
-        if minute_match:
-            minutes = int(minute_match.group(1))
-
-        if not hour_match and not minute_match:
+        hours = minutes = number = 0
+        has_number = after_space = seen_hours = seen_minutes = False
+
+        # Single pass: accumulate digits and assign them on 'h' / 'm'
+        for ch in value:
+            if '0' <= ch <= '9':
+                if after_space:
+                    number, after_space = 0, False
+                number = number * 10 + (ord(ch) - 48)
+                has_number = True
+            elif ch == 'h' or ch == 'H':
+                if has_number and not seen_hours:
+                    hours, seen_hours = number, True
+                number, has_number, after_space = 0, False, False
+            elif ch == 'm' or ch == 'M':
+                if has_number and not seen_minutes:
+                    minutes, seen_minutes = number, True
+                number, has_number, after_space = 0, False, False
+            elif ch.isspace():
+                after_space = has_number
+            else:
+                number, has_number, after_space = 0, False, False
+
+        if not seen_hours and not seen_minutes:
             raise serializers.ValidationError(
                 "Invalid format. Use 'h' for hours and 'm' for minutes (e.g., '1h 30m', '1h', or '30m')."
             )
@@ -79,12 +108,15 @@ class TimeEntrySerializer(serializers.ModelSerializer):
         if minutes >= 60:
             raise serializers.ValidationError("Minutes must be less than 60.")
 
-        return Decimal(hours) + (Decimal(minutes) / 60)
+        return Decimal(hours) + _MINUTE_HOURS[minutes]
 
     def create(self, validated_data):
         """
         Create a TimeEntry instance after converting duration to hours.
 
+        TimeEntry has no many-to-many or nested fields, so the instance is
+        created directly instead of through `ModelSerializer.create`.
+
         Args:
             validated_data (dict): Validated serializer data.
 
@@ -92,23 +124,52 @@ class TimeEntrySerializer(serializers.ModelSerializer):
             TimeEntry: The created TimeEntry instance.
         """
         validated_data['hours'] = validated_data.pop('duration')
-        return super().create(validated_data)
+        return models.TimeEntry._default_manager.create(**validated_data)
 
 
-    def create(self, validated_data):
-        validated_data['hours'] = validated_data.pop('duration')
-        return super().create(validated_data)
+class ProjectSummaryListSerializer(serializers.ListSerializer):
+    """
+    List serializer for project summaries built from `values()` rows.
 
+    Each row dict is mapped straight to its output dict, instead of running
+    the child serializer over every row; only `total_hours` goes through the
+    child's DecimalField, since aggregates are not quantized by every database
+    backend (SQLite returns them unrounded). Querysets are streamed in chunks
+    rather than cached in full.
+    """
+    def to_representation(self, data):
+        """
+        Convert summary rows into their output representation.
+
+        Args:
+            data (QuerySet | list[dict]): Rows with id, name, and total_hours keys.
 
-class ProjectSummarySerializer(serializers.ModelSerializer):
+        Returns:
+            list[dict]: Summaries with `total_hours` as a two-place decimal string.
+        """
+        hours_to_representation = self.child.fields['total_hours'].to_representation
+        rows = data.iterator(chunk_size=500) if isinstance(data, QuerySet) else data
+        return [
+            {
+                'id': row['id'],
+                'name': row['name'],
+                'total_hours': hours_to_representation(row['total_hours']),
+            }
+            for row in rows
+        ]
+
+
+class ProjectSummarySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for project summaries.
 
     Adds a computed field `total_hours` representing the sum of all time entries
-    for a given project.
+    for a given project. Lists use `ProjectSummaryListSerializer`, which expects
+    the `values()` rows produced by the summary view.
     """
     total_hours = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
 
     class Meta:
         model = models.Project
-        fields = ['id', 'name', 'total_hours']
\ No newline at end of file
+        fields = ['id', 'name', 'total_hours']
+        list_serializer_class = ProjectSummaryListSerializer
@@ -0,0 +1,242 @@
+from django.db.models import Case, DecimalField, F, QuerySet, Sum, Value, When
+from django.db.models.functions import Now
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from main_app.api.time_management.caching import bump_summary_version
+from main_app.api.time_management.models import Project, ProjectDailyHours, Task, TimeEntry
+
+
+def _task_owner_id(task_id):
+    """
+    Return the ID of the user owning the project of a task.
+
+    Args:
+        task_id (int): Primary key of the task.
+
+    Returns:
+        int | None: The owner's ID, or None if the task no longer exists.
+    """
+    return Project.objects.filter(tasks__id=task_id).values_list('owner_id', flat=True).first()
+
+
+def _entry_project_id(instance):
+    """
+    Return the ID of the project a time entry belongs to.
+
+    Uses the entry's task when it is already loaded, and queries it otherwise.
+
+    Args:
+        instance (TimeEntry): The time entry.
+
+    Returns:
+        int | None: The project's ID, or None if the task no longer exists.
+    """
+    if TimeEntry.task.is_cached(instance):
+        return instance.task.project_id
+    return Task.objects.filter(pk=instance.task_id).values_list('project_id', flat=True).first()
+
+
+def _is_cascade_from(origin, *models):
+    """
+    Tell whether a deletion was started on an instance or queryset of given models.
+
+    Args:
+        origin (Model | QuerySet): The `origin` sent with the delete signals.
+        *models (type[Model]): The models to check for.
+
+    Returns:
+        bool: True if the deletion originates from one of the models.
+    """
+    if isinstance(origin, QuerySet):
+        return issubclass(origin.model, models)
+    return isinstance(origin, models)
+
+
+def _apply_hours_delta(project_id, day, delta):
+    """
+    Add a change in logged hours to a project's cached total and daily bucket.
+
+    Args:
+        project_id (int): Primary key of the project.
+        day (date): The day the hours were logged on.
+        delta (Decimal): Hours to add (negative to remove).
+
+    Returns:
+        None
+    """
+    if not delta:
+        return
+    Project.objects.filter(pk=project_id).update(
+        cached_total_hours=F('cached_total_hours') + delta, updated_at=Now()
+    )
+    updated = ProjectDailyHours.objects.filter(project_id=project_id, date=day).update(hours=F('hours') + delta)
+    if not updated and delta > 0:
+        bucket, created = ProjectDailyHours.objects.get_or_create(
+            project_id=project_id, date=day, defaults={'hours': delta}
+        )
+        if not created:
+            ProjectDailyHours.objects.filter(pk=bucket.pk).update(hours=F('hours') + delta)
+
+
+@receiver(pre_save, sender=TimeEntry)
+def remember_time_entry_hours(sender, instance, **kwargs):
+    """
+    Signal handler that records the stored project, date, and hours of a TimeEntry
+    before it is updated, so the saved change can be applied as a delta.
+
+    Callers that already loaded those values can set `_stored_hours` on the
+    instance beforehand to skip the query.
+
+    Args:
+        sender (Model): The model class (TimeEntry) that triggered the signal.
+        instance (TimeEntry): The TimeEntry instance being saved.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    if instance.pk and '_stored_hours' not in instance.__dict__:
+        instance._stored_hours = (
+            TimeEntry.objects
+            .filter(pk=instance.pk)
+            .values_list('task__project_id', 'date', 'hours')
+            .first()
+        )
+
+
+@receiver(post_save, sender=TimeEntry)
+def add_time_entry_hours(sender, instance, **kwargs):
+    """
+    Signal handler that applies a saved TimeEntry to its project's cached hours.
+
+    Args:
+        sender (Model): The model class (TimeEntry) that triggered the signal.
+        instance (TimeEntry): The TimeEntry instance that was saved.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    project_id = _entry_project_id(instance)
+    stored = instance.__dict__.pop('_stored_hours', None)
+    if stored is not None:
+        stored_project_id, stored_date, stored_hours = stored
+        if (stored_project_id, stored_date) == (project_id, instance.date):
+            _apply_hours_delta(project_id, instance.date, instance.hours - stored_hours)
+            return
+        _apply_hours_delta(stored_project_id, stored_date, -stored_hours)
+    if project_id is not None:
+        _apply_hours_delta(project_id, instance.date, instance.hours)
+
+
+@receiver(post_delete, sender=TimeEntry)
+def remove_time_entry_hours(sender, instance, origin=None, **kwargs):
+    """
+    Signal handler that removes a deleted TimeEntry from its project's cached hours.
+
+    Entries deleted along with their task or project are skipped: the task's
+    hours are removed in bulk by `remove_task_hours`, and a deleted project's
+    cached hours go with it.
+
+    Args:
+        sender (Model): The model class (TimeEntry) that triggered the signal.
+        instance (TimeEntry): The TimeEntry instance that was deleted.
+        origin (Model | QuerySet, optional): Where the deletion started.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    if _is_cascade_from(origin, Project, Task):
+        return
+    project_id = _entry_project_id(instance)
+    if project_id is not None:
+        _apply_hours_delta(project_id, instance.date, -instance.hours)
+
+
+@receiver(pre_delete, sender=Task)
+def remove_task_hours(sender, instance, origin=None, **kwargs):
+    """
+    Signal handler that removes a deleted Task's time entries from its project's
+    cached hours and invalidates the owner's cached summaries.
+
+    The entries are summed per day in one query, then the project total and
+    all affected daily buckets are updated with one query each, instead of
+    once per entry. Nothing is done when the whole project is being deleted.
+
+    Args:
+        sender (Model): The model class (Task) that triggered the signal.
+        instance (Task): The Task instance being deleted.
+        origin (Model | QuerySet, optional): Where the deletion started.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    if _is_cascade_from(origin, Project):
+        return
+    daily = dict(
+        TimeEntry.objects
+        .filter(task_id=instance.pk)
+        .order_by()
+        .values('date')
+        .annotate(total=Sum('hours'))
+        .values_list('date', 'total')
+    )
+    if not daily:
+        return
+    Project.objects.filter(pk=instance.project_id).update(
+        cached_total_hours=F('cached_total_hours') - sum(daily.values()), updated_at=Now()
+    )
+    ProjectDailyHours.objects.filter(project_id=instance.project_id, date__in=daily).update(
+        hours=F('hours') - Case(
+            *(When(date=day, then=Value(hours)) for day, hours in daily.items()),
+            output_field=DecimalField(max_digits=10, decimal_places=2)
+        )
+    )
+    owner_id = _task_owner_id(instance.pk)
+    if owner_id is not None:
+        bump_summary_version(owner_id)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_summary(sender, instance, **kwargs):
+    """
+    Signal handler that invalidates cached summaries when a Project changes.
+
+    Args:
+        sender (Model): The model class (Project) that triggered the signal.
+        instance (Project): The Project instance being saved or deleted.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    bump_summary_version(instance.owner_id)
+
+
+@receiver(post_save, sender=TimeEntry)
+@receiver(post_delete, sender=TimeEntry)
+def invalidate_time_entry_summary(sender, instance, origin=None, **kwargs):
+    """
+    Signal handler that invalidates cached summaries when a TimeEntry changes.
+
+    Entries deleted along with their task or project are skipped, since
+    `remove_task_hours` and `invalidate_project_summary` invalidate the
+    summaries once for the whole deletion.
+
+    Args:
+        sender (Model): The model class (TimeEntry) that triggered the signal.
+        instance (TimeEntry): The TimeEntry instance being saved or deleted.
+        origin (Model | QuerySet, optional): Where the deletion started.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        None
+    """
+    if _is_cascade_from(origin, Project, Task):
+        return
+    owner_id = _task_owner_id(instance.task_id)
+    if owner_id is not None:
+        bump_summary_version(owner_id)
@@ -0,0 +1,47 @@
+from decimal import Decimal
+from django.db.models import F, Sum, DecimalField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from main_app.api.time_management.models import ProjectDailyHours
+
+
+def project_summary_rows(queryset, start_date=None, end_date=None):
+    """
+    Annotate projects with their total tracked hours and return them as dict rows.
+
+    Totals are read from the pre-aggregated hours kept up to date by the
+    TimeEntry signals: the all-time total is the project's `cached_total_hours`
+    column, and a date range sums the project's daily buckets in that range,
+    so the time entries themselves are never scanned.
+
+    Args:
+        queryset (QuerySet): The projects to summarize.
+        start_date (str | date | None): Only count time entries from this date on.
+        end_date (str | date | None): Only count time entries up to this date.
+            Both dates are required for the range to apply.
+
+    Returns:
+        QuerySet: `values()` rows with id, name, and total_hours, ordered by
+            total_hours descending.
+    """
+    if start_date and end_date:
+        hours_in_range = (
+            ProjectDailyHours.objects
+            .filter(project=OuterRef('pk'), date__range=[start_date, end_date])
+            .order_by()
+            .values('project')
+            .annotate(total=Sum('hours'))
+            .values('total')
+        )
+
+        summary_qs = queryset.annotate(
+            total_hours=Coalesce(
+                Subquery(hours_in_range),
+                Decimal('0.00'),
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            )
+        )
+    else:
+        # All time
+        summary_qs = queryset.annotate(total_hours=F('cached_total_hours'))
+
+    return summary_qs.order_by('-total_hours').values('id', 'name', 'total_hours')
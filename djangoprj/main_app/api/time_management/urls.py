@@ -6,10 +6,12 @@ URL patterns for project, task, and time entry management.
 
 Endpoints:
 - /projects/                : List all projects or create a new one.
+                              Lists accept `?page=` and `?size=` for pagination.
 - /projects/<id>/           : Retrieve, update, or delete a specific project.
 - /projects/summary/        : Get a summary of all projects with total tracked hours.
 
-- /projects/<project_id>/tasks/ : List tasks for a project or create a new one.
+- /projects/<project_id>/tasks/ : List tasks for a project (with `?with_totals=1`, including
+                                  their total hours) or create a new one.
 - /tasks/<id>/                  : Retrieve, update, or delete a specific task.
 
 - /tasks/<task_id>/time-entries/ : List or create time entries for a specific task.
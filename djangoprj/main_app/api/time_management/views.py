@@ -1,17 +1,90 @@
 from decimal import Decimal
-from django.db.models import Sum, Q, DecimalField, FilteredRelation
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, Max, Sum
 from django.db.models.functions import Coalesce
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
+from main_app.api.authentication.authentication import CachedTokenAuthentication
+from main_app.api.time_management.caching import SUMMARY_CACHE_TIMEOUT, summary_cache_key
 from main_app.api.time_management.models import Project, Task, TimeEntry
+from main_app.api.time_management.summaries import project_summary_rows
 from main_app.api.time_management.serializers import (
     ProjectSerializer, 
     TaskSerializer, 
+    TaskWithTotalsSerializer,
     TimeEntrySerializer, 
     ProjectSummarySerializer
 )
 
+# Columns loaded for time entries and their selected task, project, and user
+TIME_ENTRY_FIELDS = (
+    'id', 'hours', 'comment', 'date',
+    'task__id', 'task__name', 'task__project__id', 'task__project__name',
+    'user__id', 'user__username',
+)
+
+# Default and maximum number of rows per page for `?page=` list requests
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def paginate(queryset, request):
+    """
+    Slice a list queryset to the page requested with `?page=` and `?size=`.
+
+    Pages are numbered from 1 and rows are ordered by ID so pages are stable.
+    With `?lookahead=1`, the first row of the next page is included as well, so
+    clients can tell whether another page exists without counting the rows.
+    Without a valid `page` parameter the queryset is returned unchanged.
+
+    Args:
+        queryset (QuerySet): The rows to paginate.
+        request (Request): The HTTP request with the optional query parameters.
+
+    Returns:
+        QuerySet: The rows of the requested page, or all rows.
+    """
+    try:
+        page = int(request.query_params['page'])
+        size = int(request.query_params.get('size', DEFAULT_PAGE_SIZE))
+    except (KeyError, ValueError):
+        return queryset
+    page = max(page, 1)
+    size = min(max(size, 1), MAX_PAGE_SIZE)
+    start = (page - 1) * size
+    end = start + size + (request.query_params.get('lookahead') == '1')
+    return queryset.order_by('id')[start:end]
+
+
+def project_summary_etag(request, *args, **kwargs):
+    """
+    Build the ETag of the authenticated user's project summary.
+
+    Any project change, and any hours logged, edited, or removed on a project,
+    moves the project's `updated_at`; deleting a project changes the count.
+    Both are read in one aggregate over the user's projects.
+
+    Args:
+        request (Request): The HTTP request object.
+        *args: Additional positional arguments.
+        **kwargs: Additional keyword arguments.
+
+    Returns:
+        str: An ETag derived from the user ID, the projects' state, and the
+            requested date range.
+    """
+    start_date = request.GET.get('start_date')
+    end_date = request.GET.get('end_date')
+    if not (start_date and end_date):
+        start_date = end_date = None
+    stamp = Project.objects.filter(owner_id=request.user.id).aggregate(
+        count=Count('id'), updated=Max('updated_at')
+    )
+    updated = stamp['updated'].isoformat() if stamp['updated'] else ''
+    return f"{request.user.id}:{stamp['count']}:{updated}:{start_date}:{end_date}"
+
 
 class ProjectAPIView(generics.GenericAPIView):
     """
@@ -21,22 +94,33 @@ class ProjectAPIView(generics.GenericAPIView):
     and deleting their own projects.
     """
     serializer_class = ProjectSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         """
         Limit the queryset to projects owned by the authenticated user.
 
+        Only the columns exposed by `ProjectSerializer` are loaded, plus
+        `updated_at` so that saving a loaded project still refreshes it.
+
         Returns:
             QuerySet: Projects belonging to the current user.
         """
-        return Project.objects.filter(owner=self.request.user)
+        return (
+            Project.objects
+            .only(*ProjectSerializer.Meta.fields, 'updated_at')
+            .filter(owner_id=self.request.user.id)
+        )
 
     def get(self, request, pk=None):
         """
         Handle GET requests.
 
+        The list is read with `values()` and returned as plain dicts, matching
+        the `ProjectSerializer` output without building model instances.
+        It can be paginated with `?page=` and `?size=`.
+
         Args:
             request (Request): The HTTP request object.
             pk (int, optional): Primary key of the project (if provided).
@@ -48,9 +132,8 @@ class ProjectAPIView(generics.GenericAPIView):
             project = generics.get_object_or_404(self.get_queryset(), pk=pk)
             serializer = self.serializer_class(project)
             return Response(serializer.data)
-        projects = self.get_queryset()
-        serializer = self.serializer_class(projects, many=True)
-        return Response(serializer.data)
+        projects = paginate(self.get_queryset(), request).values('id', 'name', 'description', 'owner')
+        return Response(list(projects))
 
     def post(self, request):
         """
@@ -112,22 +195,32 @@ class ProjectSummaryAPIView(generics.GenericAPIView):
     time entries considered in the summary.
     """
     serializer_class = ProjectSummarySerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         """
         Limit the queryset to projects owned by the authenticated user.
 
+        Only the id and name are loaded; `total_hours` is annotated by the view.
+
         Returns:
             QuerySet: Projects belonging to the current user.
         """
-        return Project.objects.filter(owner=self.request.user)
+        return Project.objects.only('id', 'name').filter(owner_id=self.request.user.id)
 
+    @method_decorator(condition(etag_func=project_summary_etag))
     def get(self, request, *args, **kwargs):
         """
         Handle GET requests to retrieve project summaries.
 
+        The aggregation runs in a single query and rows are read as plain dicts
+        from `values()`, without building Project instances, then mapped by
+        `ProjectSummaryListSerializer` in one pass. Results are cached briefly per
+        user and date range; any project or time entry change invalidates them.
+        Requests whose `If-None-Match` matches the current ETag get a
+        304 Not Modified without the summary being built.
+
         Args:
             request (Request): The HTTP request object. May include optional
                 query parameters:
@@ -139,39 +232,20 @@ class ProjectSummaryAPIView(generics.GenericAPIView):
         Returns:
             Response: A list of projects with their total tracked hours.
         """
-        base_qs = self.get_queryset()
-
         start_date = request.query_params.get('start_date')
         end_date = request.query_params.get('end_date')
+        if not (start_date and end_date):
+            start_date = end_date = None
 
-        if start_date and end_date:
-            base_qs = base_qs.annotate(
-                filtered_time_entries=FilteredRelation(
-                    'tasks__time_entries',
-                    condition=Q(tasks__time_entries__date__range=[start_date, end_date])
-                )
-            )
-
-            summary_qs = base_qs.annotate(
-                total_hours=Coalesce(
-                    Sum('filtered_time_entries__hours'),
-                    Decimal('0.00'),
-                    output_field=DecimalField()
-                )
-            )
-        else:
-            # All time
-            summary_qs = base_qs.annotate(
-                total_hours=Coalesce(
-                    Sum('tasks__time_entries__hours'),
-                    Decimal('0.00'),
-                    output_field=DecimalField()
-                )
-            )
+        cache_key = summary_cache_key(request.user.id, start_date, end_date)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
 
-        summary_qs = summary_qs.order_by('-total_hours')
-        serializer = self.get_serializer(summary_qs, many=True)
-        return Response(serializer.data)
+        summary_qs = project_summary_rows(self.get_queryset(), start_date, end_date)
+        data = list(self.get_serializer(summary_qs, many=True).data)
+        cache.set(cache_key, data, SUMMARY_CACHE_TIMEOUT)
+        return Response(data)
 
 
 class TaskAPIView(generics.GenericAPIView):
@@ -182,17 +256,25 @@ class TaskAPIView(generics.GenericAPIView):
     and deleting tasks that belong to their own projects.
     """
     serializer_class = TaskSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         """
         Limit the queryset to tasks belonging to projects owned by the authenticated user.
 
+        The project is selected through the join already needed for the owner
+        filter, and only the columns exposed by `TaskSerializer` are loaded.
+
         Returns:
             QuerySet: Tasks linked to the current user's projects.
         """
-        return Task.objects.filter(project__owner=self.request.user)
+        return (
+            Task.objects
+            .select_related('project')
+            .only(*TaskSerializer.Meta.fields, 'project__id', 'project__owner')
+            .filter(project__owner_id=self.request.user.id)
+        )
 
     def get(self, request, pk=None, project_id=None):
         """
@@ -202,6 +284,9 @@ class TaskAPIView(generics.GenericAPIView):
             request (Request): The HTTP request object.
             pk (int, optional): Primary key of a task to retrieve.
             project_id (int, optional): ID of a project to list its tasks.
+                With `?with_totals=1`, each listed task also includes its
+                `total_hours`, summed in the same query. The list can be
+                paginated with `?page=` and `?size=`.
 
         Returns:
             Response: 
@@ -216,7 +301,17 @@ class TaskAPIView(generics.GenericAPIView):
             return Response(serializer.data)
         if project_id:
             tasks = queryset.filter(project_id=project_id)
-            serializer = self.serializer_class(tasks, many=True)
+            if request.query_params.get('with_totals') == '1':
+                tasks = tasks.annotate(
+                    total_hours=Coalesce(
+                        Sum('time_entries__hours'),
+                        Decimal('0.00'),
+                        output_field=DecimalField(max_digits=10, decimal_places=2)
+                    )
+                )
+                serializer = TaskWithTotalsSerializer(paginate(tasks, request), many=True)
+            else:
+                serializer = self.serializer_class(paginate(tasks, request), many=True)
             return Response(serializer.data)
         return Response([])
 
@@ -232,7 +327,9 @@ class TaskAPIView(generics.GenericAPIView):
             Response: Serialized task data if created successfully,
                       or validation errors otherwise.
         """
-        project = generics.get_object_or_404(Project, pk=project_id, owner=request.user)
+        project = generics.get_object_or_404(
+            Project.objects.only('id'), pk=project_id, owner_id=request.user.id
+        )
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             serializer.save(project=project)
@@ -282,7 +379,7 @@ class TimeEntryListCreateAPIView(generics.GenericAPIView):
     - Create a new time entry for a given task (POST).
     """
     serializer_class = TimeEntrySerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
@@ -290,15 +387,26 @@ class TimeEntryListCreateAPIView(generics.GenericAPIView):
         Limit the queryset to time entries belonging to tasks
         within projects owned by the authenticated user.
 
+        The task, its project, and the user are joined in the same query and
+        only the columns used by the serializer and `__str__` are loaded.
+
         Returns:
             QuerySet: Time entries owned by the current user.
         """
-        return TimeEntry.objects.filter(task__project__owner=self.request.user)
+        return (
+            TimeEntry.objects
+            .select_related('task__project', 'user')
+            .only(*TIME_ENTRY_FIELDS)
+            .filter(task__project__owner_id=self.request.user.id)
+        )
 
     def get(self, request, task_id):
         """
         Handle GET requests to list all time entries for a task.
 
+        The entries are loaded once, with only the serialized columns, and the
+        total is summed from those rows instead of with a second aggregate query.
+
         Args:
             request (Request): The HTTP request object.
             task_id (int): ID of the task for which to retrieve time entries.
@@ -306,12 +414,18 @@ class TimeEntryListCreateAPIView(generics.GenericAPIView):
         Returns:
             Response: JSON object containing:
                 - entries (list): Serialized time entry data.
-                - total_hours (float): Sum of all hours tracked for the task.
-        """
-        queryset = self.get_queryset().filter(task_id=task_id)
-        serializer = self.serializer_class(queryset, many=True)
-        total_hours = queryset.aggregate(Sum('hours'))['hours__sum'] or Decimal('0.00')
-        return Response({'entries': serializer.data, 'total_hours': float(total_hours)})
+                - total_hours (str): Sum of all hours tracked for the task, as a
+                  decimal string.
+        """
+        entries = list(
+            self.get_queryset()
+            .filter(task_id=task_id)
+            .select_related(None)
+            .only('id', 'comment', 'date', 'hours')
+        )
+        serializer = self.serializer_class(entries, many=True)
+        total_hours = sum((entry.hours for entry in entries), Decimal('0.00'))
+        return Response({'entries': serializer.data, 'total_hours': str(total_hours)})
 
     def post(self, request, task_id):
         """
@@ -325,7 +439,9 @@ class TimeEntryListCreateAPIView(generics.GenericAPIView):
             Response: Serialized time entry data if created successfully,
                       or validation errors otherwise.
         """
-        task = generics.get_object_or_404(Task, pk=task_id, project__owner=request.user)
+        task = generics.get_object_or_404(
+            Task.objects.only('id', 'project'), pk=task_id, project__owner_id=request.user.id
+        )
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             serializer.save(task=task, user=request.user)
@@ -343,7 +459,7 @@ class TimeEntryDetailAPIView(generics.GenericAPIView):
     - Delete a time entry (DELETE).
     """
     serializer_class = TimeEntrySerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
@@ -351,10 +467,18 @@ class TimeEntryDetailAPIView(generics.GenericAPIView):
         Limit the queryset to time entries belonging to tasks
         within projects owned by the authenticated user.
 
+        The task, its project, and the user are joined in the same query and
+        only the columns used by the serializer and `__str__` are loaded.
+
         Returns:
             QuerySet: Time entries owned by the current user.
         """
-        return TimeEntry.objects.filter(task__project__owner=self.request.user)
+        return (
+            TimeEntry.objects
+            .select_related('task__project', 'user')
+            .only(*TIME_ENTRY_FIELDS)
+            .filter(task__project__owner_id=self.request.user.id)
+        )
 
     def get(self, request, pk):
         """
@@ -384,6 +508,8 @@ class TimeEntryDetailAPIView(generics.GenericAPIView):
                       or validation errors if invalid.
         """
         entry = generics.get_object_or_404(self.get_queryset(), pk=pk)
+        # The stored values are already loaded, so the hours signals reuse them
+        entry._stored_hours = (entry.task.project_id, entry.date, entry.hours)
         serializer = self.serializer_class(entry, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
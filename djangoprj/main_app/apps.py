@@ -6,4 +6,5 @@ class MainAppConfig(AppConfig):
     name = 'main_app'
 
     def ready(self):
-        import main_app.api.authentication.signals
\ No newline at end of file
+        import main_app.api.authentication.signals
+        import main_app.api.time_management.signals
\ No newline at end of file
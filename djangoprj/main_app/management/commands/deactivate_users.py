@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from main_app.api.authentication.services import deactivate_users
+
+
+class Command(BaseCommand):
+    """
+    Deactivate users in bulk and invalidate their cached token lookups.
+
+    Usage:
+        python manage.py deactivate_users alice bob
+    """
+    help = "Deactivate the given users and evict their cached tokens."
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='+', help="Usernames of the users to deactivate.")
+
+    def handle(self, *args, **options):
+        usernames = options['usernames']
+        queryset = User.objects.filter(username__in=usernames)
+
+        missing = set(usernames) - set(queryset.values_list('username', flat=True))
+        if missing:
+            raise CommandError(f"Unknown users: {', '.join(sorted(missing))}")
+
+        count = deactivate_users(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {count} user(s)."))
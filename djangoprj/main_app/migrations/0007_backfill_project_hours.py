@@ -0,0 +1,42 @@
+from django.db import migrations
+from django.db.models import Sum
+
+
+def backfill_project_hours(apps, schema_editor):
+    """
+    Fill the cached project totals and daily buckets from existing time entries.
+    """
+    Project = apps.get_model('main_app', 'Project')
+    ProjectDailyHours = apps.get_model('main_app', 'ProjectDailyHours')
+    TimeEntry = apps.get_model('main_app', 'TimeEntry')
+
+    daily_rows = (
+        TimeEntry.objects
+        .order_by()
+        .values('task__project_id', 'date')
+        .annotate(total=Sum('hours'))
+    )
+    totals = {}
+    buckets = []
+    for row in daily_rows.iterator():
+        project_id = row['task__project_id']
+        totals[project_id] = totals.get(project_id, 0) + row['total']
+        buckets.append(ProjectDailyHours(project_id=project_id, date=row['date'], hours=row['total']))
+    ProjectDailyHours.objects.bulk_create(buckets, batch_size=500)
+
+    projects = []
+    for project in Project.objects.filter(pk__in=totals).only('id'):
+        project.cached_total_hours = totals[project.pk]
+        projects.append(project)
+    Project.objects.bulk_update(projects, ['cached_total_hours'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0006_project_cached_total_hours_projectdailyhours'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_project_hours, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from main_app.api.time_management.caching import summary_version_cache_key
+from main_app.api.time_management.models import Project, ProjectDailyHours, Task, TimeEntry
+
+
+class CascadeDeleteHoursTests(TestCase):
+    """
+    Tests for the cached project hours when tasks and projects are deleted.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='alice', password='secret-pass-123')
+        self.project = Project.objects.create(name='Tracked', owner=self.user)
+        self.kept = Task.objects.create(project=self.project, name='Kept')
+        self.deleted = Task.objects.create(project=self.project, name='Deleted')
+        for task, hours, day in (
+            (self.kept, '1.00', date(2025, 3, 10)),
+            (self.deleted, '0.50', date(2025, 3, 10)),
+            (self.deleted, '0.25', date(2025, 3, 10)),
+            (self.deleted, '2.00', date(2025, 3, 11)),
+        ):
+            TimeEntry.objects.create(task=task, user=self.user, hours=Decimal(hours), date=day)
+
+    def daily_hours(self):
+        return dict(ProjectDailyHours.objects.filter(project=self.project).values_list('date', 'hours'))
+
+    def test_task_delete_removes_its_hours_in_bulk(self):
+        version = cache.get(summary_version_cache_key(self.user.id))
+
+        with self.assertNumQueries(7):
+            self.deleted.delete()
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.cached_total_hours, Decimal('1.00'))
+        self.assertEqual(self.daily_hours(), {date(2025, 3, 10): Decimal('1.00'), date(2025, 3, 11): Decimal('0.00')})
+        self.assertEqual(cache.get(summary_version_cache_key(self.user.id)), version + 1)
+
+    def test_project_delete_skips_per_entry_updates(self):
+        with self.assertNumQueries(6):
+            self.project.delete()
+
+        self.assertFalse(ProjectDailyHours.objects.exists())
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import time
+from django.test import SimpleTestCase, override_settings
+from main_app.api.exports.jobs import DOWNLOAD_URL_MAX_AGE, exports_dir, keep_export_file, purge_expired_exports
+
+
+class ExportExpiryTests(SimpleTestCase):
+    """
+    Tests for the expiry of generated export files.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        exports_dir().mkdir()
+
+    def make_file(self, name, age):
+        path = exports_dir() / name
+        path.write_bytes(b'xlsx')
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_purge_deletes_only_files_past_the_link_lifetime(self):
+        expired = self.make_file('expired.xlsx', DOWNLOAD_URL_MAX_AGE + 60)
+        recent = self.make_file('recent.xlsx', 60)
+
+        self.assertEqual(purge_expired_exports(), 1)
+        self.assertFalse(expired.exists())
+        self.assertTrue(recent.exists())
+
+    def test_issuing_a_link_keeps_the_file(self):
+        path = self.make_file('linked.xlsx', DOWNLOAD_URL_MAX_AGE + 60)
+
+        self.assertTrue(keep_export_file('linked.xlsx'))
+        self.assertEqual(purge_expired_exports(), 0)
+        self.assertTrue(path.exists())
+        self.assertFalse(keep_export_file('missing.xlsx'))
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from main_app.api.authentication.authentication import login_failures_cache_key
+from main_app.api.authentication.views import LOGIN_MAX_FAILED_ATTEMPTS
+
+
+class LoginTests(APITestCase):
+    """
+    Tests for the login endpoint's failed-attempt throttling.
+    """
+
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username='alice', password='secret-pass-123')
+
+    def login(self, password, client_ip):
+        return self.client.post(
+            '/auth/login/', {'username': 'alice', 'password': password}, REMOTE_ADDR=client_ip
+        )
+
+    def test_failures_lock_out_only_the_failing_client(self):
+        for _ in range(LOGIN_MAX_FAILED_ATTEMPTS):
+            self.assertEqual(self.login('wrong', '10.0.0.1').status_code, 401)
+
+        self.assertEqual(self.login('secret-pass-123', '10.0.0.1').status_code, 429)
+        self.assertEqual(self.login('secret-pass-123', '10.0.0.2').status_code, 200)
+
+    def test_unknown_username_is_rejected(self):
+        response = self.client.post('/auth/login/', {'username': 'nobody', 'password': 'whatever'})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_failure_counter_expiring_before_incr_restarts_it(self):
+        with patch.object(cache, 'incr', side_effect=ValueError):
+            response = self.login('wrong', '10.0.0.1')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(cache.get(login_failures_cache_key('alice', '10.0.0.1')), 1)
+
+    @override_settings(CLIENT_IP_HEADER='HTTP_X_FORWARDED_FOR')
+    def test_failures_behind_a_proxy_lock_out_only_the_forwarded_client(self):
+        def login(password, forwarded_for):
+            return self.client.post(
+                '/auth/login/', {'username': 'alice', 'password': password},
+                REMOTE_ADDR='10.0.0.254', HTTP_X_FORWARDED_FOR=forwarded_for
+            )
+
+        for _ in range(LOGIN_MAX_FAILED_ATTEMPTS):
+            self.assertEqual(login('wrong', '203.0.113.7').status_code, 401)
+
+        self.assertEqual(login('secret-pass-123', '203.0.113.7').status_code, 429)
+        # A spoofed first hop does not escape the lockout
+        self.assertEqual(login('secret-pass-123', '198.51.100.1, 203.0.113.7').status_code, 429)
+        self.assertEqual(login('secret-pass-123', '203.0.113.8').status_code, 200)
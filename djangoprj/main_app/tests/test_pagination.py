@@ -0,0 +1,30 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from main_app.api.time_management.models import Project
+
+
+class ProjectPaginationTests(APITestCase):
+    """
+    Tests for the paginated project list.
+    """
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='alice', password='secret-pass-123')
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        Project.objects.bulk_create(Project(name=f'Project {i}', owner=user) for i in range(4))
+
+    def names(self, **params):
+        response = self.client.get('/projects/', params)
+        self.assertEqual(response.status_code, 200)
+        return [project['name'] for project in response.data]
+
+    def test_lookahead_includes_the_next_page_first_row(self):
+        self.assertEqual(self.names(page=1, size=2), ['Project 0', 'Project 1'])
+        self.assertEqual(self.names(page=1, size=2, lookahead=1), ['Project 0', 'Project 1', 'Project 2'])
+
+    def test_lookahead_on_the_last_full_page_adds_nothing(self):
+        self.assertEqual(self.names(page=2, size=2, lookahead=1), ['Project 2', 'Project 3'])
@@ -0,0 +1,26 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+
+class ProfileTests(APITestCase):
+    """
+    Tests for the profile endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='alice', email='alice@example.com', password='secret-pass-123')
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    def test_patch_updates_profile_and_etag(self):
+        etag = self.client.get('/auth/profile/')['ETag']
+
+        response = self.client.patch('/auth/profile/', {'company': 'Acme'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['company'], 'Acme')
+        self.assertEqual(response.data['user_email'], 'alice@example.com')
+        self.assertEqual(self.client.get('/auth/profile/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,45 @@
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from main_app.api.time_management.models import Project, Task, TimeEntry
+
+
+class ProjectSummaryTests(APITestCase):
+    """
+    Tests for the project summary endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='alice', password='secret-pass-123')
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        self.project = Project.objects.create(name='Tracked', owner=self.user)
+        self.empty_project = Project.objects.create(name='Empty', owner=self.user)
+        task = Task.objects.create(project=self.project, name='Work')
+        # 6m + 12m + 7m
+        for hours in ('0.10', '0.20', '0.12'):
+            TimeEntry.objects.create(task=task, user=self.user, hours=Decimal(hours), date=date(2025, 3, 10))
+        TimeEntry.objects.create(task=task, user=self.user, hours=Decimal('1.00'), date=date(2025, 4, 1))
+
+    def test_date_range_totals_are_two_place_strings(self):
+        response = self.client.get('/projects/summary/', {'start_date': '2025-03-01', 'end_date': '2025-03-31'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row['name'], row['total_hours']) for row in response.json()],
+            [('Tracked', '0.42'), ('Empty', '0.00')],
+        )
+
+    def test_all_time_totals_are_two_place_strings(self):
+        response = self.client.get('/projects/summary/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row['name'], row['total_hours']) for row in response.json()],
+            [('Tracked', '1.42'), ('Empty', '0.00')],
+        )
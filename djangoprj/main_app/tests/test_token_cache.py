@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from main_app.api.authentication.authentication import CachedTokenAuthentication, token_cache_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Tests for the cached token lookup.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='alice', password='secret-pass-123')
+        self.token = Token.objects.create(user=self.user)
+
+    def test_cache_hit_rebuilds_user_without_password(self):
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.token.key)
+
+        self.assertNotIn(self.user.password, cache.get(token_cache_key(self.token.key)))
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(self.token.key)
+            self.assertEqual((user.pk, user.username, token.key), (self.user.pk, 'alice', self.token.key))
+            self.assertTrue(user.is_active)
+        self.assertIn('password', user.get_deferred_fields())
@@ -17,11 +17,13 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from main_app.api.authentication.urls import AUTH_URLS
+from main_app.api.exports.urls import EXPORT_URLS
 from main_app.api.time_management.urls import TIME_MANAGEMENT_URLS
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include((AUTH_URLS, 'authentication'))),
+    path('exports/', include((EXPORT_URLS, 'exports'))),
     path('', include((TIME_MANAGEMENT_URLS, 'time_management'))),
 
 ]
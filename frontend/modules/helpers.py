@@ -1,17 +1,72 @@
-import io
-import pandas as pd
+from decimal import Decimal
+from functools import lru_cache
+import orjson
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from settings import API_BASE_URL
 
+# (connect, read) timeouts in seconds for backend requests
+REQUEST_TIMEOUT = (3, 15)
 
-def api_request(method, endpoint, token, json_data=None):
+# Polling of background Excel export jobs
+EXPORT_POLL_INTERVAL = 0.5
+EXPORT_POLL_ATTEMPTS = 60
+
+# Session state key holding the current Excel export job
+EXPORT_STATE_KEY = 'export_job'
+
+
+def _build_session():
     """
-    General helper for making authenticated API requests with error handling.
+    Create the HTTP session shared by all backend API requests.
+
+    The session keeps connections to the backend alive between requests,
+    retries idempotent requests on connection errors, and asks for gzip
+    responses.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    return session
+
+
+_SESSION = _build_session()
+
+
+class APIError(Exception):
+    """
+    Raised by `api_request_or_raise` when a backend request fails.
+
+    The message is meant to be shown to the user.
+    """
+
+
+class SessionExpiredError(APIError):
+    """
+    Raised by `api_request_or_raise` when the backend rejects the token (HTTP 401).
+    """
+
+
+def api_request_or_raise(method, endpoint, token, json_data=None):
+    """
+    Make an authenticated API request, raising on failure instead of rendering errors.
 
-    Sends an HTTP request to the backend API, attaching the provided token 
-    in the `Authorization` header. Handles authentication errors (401), 
-    validation errors (400), and other HTTP/connection errors gracefully.
+    Sends an HTTP request to the backend API through a shared, pooled session,
+    attaching the provided token in the `Authorization` header. Responses are
+    decoded with orjson straight from the raw bytes. Nothing is rendered, so
+    it is safe to call from functions cached with `st.cache_data`: a failed
+    request raises, and nothing gets cached.
 
     Args:
         method (str): The HTTP method (e.g., "GET", "POST", "PATCH", "DELETE").
@@ -19,31 +74,80 @@ def api_request(method, endpoint, token, json_data=None):
         token (str): Authentication token for the current user session.
         json_data (dict, optional): JSON body to include in the request.
 
+    Raises:
+        SessionExpiredError: If the token is invalid or expired (HTTP 401).
+        APIError: If any other HTTP, decoding, or connection error occurs.
+
     Returns:
-        dict | list | bool | None:
-            - Parsed JSON response for successful requests.
+        dict | list | bool:
+            - Parsed JSON response for successful requests and validation
+              errors (HTTP 400).
             - `True` if the response is HTTP 204 No Content.
-            - `None` if an error occurs (e.g., network error, 401 unauthorized).
     """
     headers = {'Authorization': f'Token {token}'}
     try:
         url = f"{API_BASE_URL}/{endpoint}"
-        response = requests.request(method, url, headers=headers, json=json_data)
+        response = _SESSION.request(method, url, headers=headers, json=json_data, timeout=REQUEST_TIMEOUT)
         if response.status_code == 401:
-            st.error("Session invalid or expired. Please log in again.")
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            st.rerun()
-            return None
+            raise SessionExpiredError("Session invalid or expired. Please log in again.")
         if response.status_code == 400:
-            return response.json()
+            return orjson.loads(response.content)
         response.raise_for_status()
-        return response.json() if response.status_code != 204 else True
+        return orjson.loads(response.content) if response.status_code != 204 else True
     except requests.exceptions.HTTPError as e:
-        st.error(f"HTTP error occurred: {e}")
-        return None
+        raise APIError(f"HTTP error occurred: {e}") from e
+    except orjson.JSONDecodeError as e:
+        raise APIError(f"Invalid response from the API: {e}") from e
     except requests.exceptions.RequestException as e:
-        st.error(f"API communication error: {e}")
+        raise APIError(f"API communication error: {e}") from e
+
+
+def show_api_error(error):
+    """
+    Render a failed API request in the Streamlit app.
+
+    An expired session also logs the user out by clearing the session state
+    and rerunning the app.
+
+    Args:
+        error (APIError): The error raised by `api_request_or_raise`.
+
+    Returns:
+        None
+    """
+    st.error(str(error))
+    if isinstance(error, SessionExpiredError):
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+        st.rerun()
+
+
+def api_request(method, endpoint, token, json_data=None):
+    """
+    General helper for making authenticated API requests with error handling.
+
+    Wraps `api_request_or_raise`, rendering failures with `show_api_error`
+    instead of raising. Handles authentication errors (401), validation
+    errors (400), and other HTTP/connection errors (including timeouts)
+    gracefully. Not meant for functions cached with `st.cache_data`, which
+    would cache the failure and replay its error.
+
+    Args:
+        method (str): The HTTP method (e.g., "GET", "POST", "PATCH", "DELETE").
+        endpoint (str): The relative API endpoint (appended to API_BASE_URL).
+        token (str): Authentication token for the current user session.
+        json_data (dict, optional): JSON body to include in the request.
+
+    Returns:
+        dict | list | bool | None:
+            - Parsed JSON response for successful requests.
+            - `True` if the response is HTTP 204 No Content.
+            - `None` if an error occurs (e.g., network error, 401 unauthorized).
+    """
+    try:
+        return api_request_or_raise(method, endpoint, token, json_data)
+    except APIError as e:
+        show_api_error(e)
         return None
 
 
@@ -51,9 +155,13 @@ def parse_hours_string(hours_decimal):
     """
     Convert a decimal number of hours into a human-readable string format.
 
+    Values are normalized to strings so repeated hours across reruns hit
+    the cache of `_format_hours`.
+
     Args:
-        hours_decimal (float | Decimal | None): The number of hours as a decimal.
-            Example: 1.5 -> "1h 30min".
+        hours_decimal (str | float | Decimal | None): The number of hours as a
+            decimal, such as the decimal strings returned by the API.
+            Example: "1.50" -> "1h 30min".
 
     Returns:
         str: A formatted string in the format "Xh Ymin".
@@ -61,18 +169,32 @@ def parse_hours_string(hours_decimal):
     """
     if hours_decimal is None:
         return "0h 0min"
-    total_minutes = int(float(hours_decimal) * 60)
+    return _format_hours(str(hours_decimal))
+
+
+@lru_cache(maxsize=4096)
+def _format_hours(hours):
+    """
+    Format a decimal string of hours as "Xh Ymin".
+
+    Args:
+        hours (str): The number of hours as a decimal string.
+
+    Returns:
+        str: A formatted string in the format "Xh Ymin".
+    """
+    total_minutes = int(Decimal(hours) * 60)
     h, m = divmod(total_minutes, 60)
     return f"{h}h {m}min"
 
 
 def export_to_excel(token, start_date, end_date):
     """
-    Export project summary data to an Excel file and provide a Streamlit download button.
+    Start an Excel export of the project summary data.
 
-    Retrieves project summary data (optionally filtered by date range) from the API, 
-    formats it into an Excel sheet, calculates the total hours, and allows the user 
-    to download the file directly from the Streamlit UI.
+    Asks the backend to build the workbook in a background job and stores the
+    job in `st.session_state`. The job is then followed by `show_excel_export`
+    without blocking the script.
 
     Args:
         token (str): Authentication token for the API request.
@@ -80,49 +202,102 @@ def export_to_excel(token, start_date, end_date):
         end_date (datetime.date | None): End date for filtering project time entries.
 
     Returns:
-        None: Displays a download button in the Streamlit app if data is available.
+        None
     """
-    endpoint = 'projects/summary/'
+    payload = {}
     if start_date and end_date:
-        endpoint += f'?start_date={start_date}&end_date={end_date}'
+        payload = {'start_date': str(start_date), 'end_date': str(end_date)}
 
-    data = api_request('get', endpoint, token)
-    if not data:
-        st.warning("No data to export for the selected period.")
+    started = api_request('post', 'exports/projects/', token, payload)
+    if not started or 'job_id' not in started:
+        st.error("Could not start the export.")
         return
 
-    df = pd.DataFrame(data)
-    df['total_hours'] = pd.to_numeric(df['total_hours'])
+    st.session_state[EXPORT_STATE_KEY] = {
+        'job_id': started['job_id'],
+        'period': (start_date, end_date),
+        'polls': 0,
+    }
 
-    if start_date and end_date:
-        sheet_name = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
-    else:
-        sheet_name = "All Time"
 
-    total_sum = df['total_hours'].sum()
+@st.fragment(run_every=EXPORT_POLL_INTERVAL)
+def _poll_export_job(token):
+    """
+    Poll the pending export job every `EXPORT_POLL_INTERVAL` seconds.
+
+    Only this fragment reruns while the job is pending. Once the job is
+    finished, or after `EXPORT_POLL_ATTEMPTS` polls, its final state is stored
+    and the whole app reruns so `show_excel_export` can render the result.
 
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df_to_export = df[['name', 'total_hours']].copy()
-        df_to_export.columns = ['Project', 'Total Hours']
-        df_to_export.to_excel(writer, index=False, sheet_name=sheet_name)
+    Args:
+        token (str): Authentication token for the API request.
+
+    Returns:
+        None
+    """
+    export = st.session_state.get(EXPORT_STATE_KEY)
+    if export is None or 'job' in export:
+        return
+
+    job = api_request('get', f"exports/{export['job_id']}/", token)
+    export['polls'] += 1
+    if job and job['status'] == 'pending' and export['polls'] < EXPORT_POLL_ATTEMPTS:
+        st.caption("Preparing Excel file...")
+        return
+
+    export['job'] = job or {'status': 'failed'}
+    st.rerun()
+
+
+def show_excel_export(token, start_date, end_date):
+    """
+    Render the state of the Excel export started by `export_to_excel`.
 
-        workbook = writer.book
-        worksheet = writer.sheets[sheet_name]
+    While the job is pending, it is polled by a fragment. Once it is done, the
+    file is fetched from the signed download URL the job returns (once per
+    job) and offered through a Streamlit download button. An export started
+    for another period is discarded.
 
-        total_row = len(df_to_export) + 1
-        worksheet.write(total_row, 0, "Total")
-        worksheet.write(total_row, 1, total_sum)
+    Args:
+        token (str): Authentication token for the API request.
+        start_date (datetime.date | None): Start date of the displayed period.
+        end_date (datetime.date | None): End date of the displayed period.
+
+    Returns:
+        None: Renders the export state directly in the Streamlit app.
+    """
+    export = st.session_state.get(EXPORT_STATE_KEY)
+    if export is None:
+        return
+    if export['period'] != (start_date, end_date):
+        del st.session_state[EXPORT_STATE_KEY]
+        return
+    if 'job' not in export:
+        _poll_export_job(token)
+        return
+
+    job = export['job']
+    if job['status'] != 'done':
+        st.error("The export could not be completed. Please try again.")
+        return
+    if not job['rows']:
+        st.warning("No data to export for the selected period.")
+        return
 
-        money_format = workbook.add_format({'num_format': '0.00'})
-        worksheet.set_column(1, 1, 12, money_format)
+    if 'content' not in export:
+        try:
+            response = _SESSION.get(f"{API_BASE_URL}{job['download_url']}", timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            st.error(f"API communication error: {e}")
+            return
+        export['content'] = response.content
 
-    output.seek(0)
     filename = "track_time_records.xlsx"
 
     st.download_button(
         label="Download Excel",
-        data=output,
+        data=export['content'],
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
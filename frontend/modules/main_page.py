@@ -2,17 +2,226 @@
 
 import streamlit as st
 import pandas as pd
-from modules.helpers import api_request, parse_hours_string, export_to_excel
+from modules.helpers import (
+    APIError,
+    api_request,
+    api_request_or_raise,
+    export_to_excel,
+    parse_hours_string,
+    show_api_error,
+    show_excel_export,
+)
 
 
 from datetime import date, timedelta
 
+# Seconds API reads are cached across Streamlit reruns
+API_CACHE_TTL = 60
+
+
+def _last_week(today):
+    """
+    Return Monday to Friday of the previous week.
+
+    Args:
+        today (datetime.date): The current date.
+
+    Returns:
+        tuple[datetime.date, datetime.date]: Start and end dates of the range.
+    """
+    start_of_last_week = today - timedelta(days=today.weekday() + 7)
+    return start_of_last_week, start_of_last_week + timedelta(days=4)
+
+
+def _last_month(today):
+    """
+    Return the first and last days of the previous month.
+
+    Args:
+        today (datetime.date): The current date.
+
+    Returns:
+        tuple[datetime.date, datetime.date]: Start and end dates of the range.
+    """
+    last_day_of_last_month = today.replace(day=1) - timedelta(days=1)
+    return last_day_of_last_month.replace(day=1), last_day_of_last_month
+
+
+# Dashboard filters mapped to functions returning their (start, end) dates for today
+DATE_RANGES = {
+    "Current Week": lambda today: (today - timedelta(days=today.weekday()), today),
+    "Last Week": _last_week,
+    "Current Month": lambda today: (today.replace(day=1), today),
+    "Last Month": _last_month,
+    "All Time": lambda today: (None, None),
+}
+
+# Projects shown in the dashboard chart; the rest are summarized in a caption
+CHART_MAX_PROJECTS = 20
+
+# Rows shown per page in the project and task lists
+LIST_PAGE_SIZE = 20
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def _fetch_summary(token, start_date, end_date):
+    """
+    Fetch the project summary, cached per token and date range across reruns.
+
+    Args:
+        token (str): Authentication token for the API request.
+        start_date (datetime.date | None): Start date of the summary period.
+        end_date (datetime.date | None): End date of the summary period.
+
+    Raises:
+        APIError: If the request failed; nothing is cached.
+
+    Returns:
+        list[dict]: Project summaries.
+    """
+    endpoint = 'projects/summary/'
+    if start_date and end_date:
+        endpoint += f'?start_date={start_date}&end_date={end_date}'
+    return api_request_or_raise('get', endpoint, token)
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def _fetch_projects(token):
+    """
+    Fetch the user's projects, cached per token across reruns.
+
+    Args:
+        token (str): Authentication token for the API request.
+
+    Raises:
+        APIError: If the request failed; nothing is cached.
+
+    Returns:
+        list[dict]: The projects.
+    """
+    return api_request_or_raise('get', 'projects/', token)
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def _fetch_projects_by_id(token):
+    """
+    Index the user's projects by ID, cached per token across reruns.
+
+    Args:
+        token (str): Authentication token for the API request.
+
+    Raises:
+        APIError: If the request failed; nothing is cached.
+
+    Returns:
+        dict[int, dict]: The projects keyed by ID.
+    """
+    return {p['id']: p for p in _fetch_projects(token)}
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def _fetch_projects_page(token, page):
+    """
+    Fetch one page of the user's projects, cached per token and page across reruns.
+
+    Args:
+        token (str): Authentication token for the API request.
+        page (int): Page number, starting at 1.
+
+    Raises:
+        APIError: If the request failed; nothing is cached.
+
+    Returns:
+        list[dict]: The projects of the page, followed by the first project of
+            the next page if there is one.
+    """
+    return api_request_or_raise('get', f"projects/?page={page}&size={LIST_PAGE_SIZE}&lookahead=1", token)
+
+
+def _load(fetch, *args):
+    """
+    Call one of the cached `_fetch_*` functions, rendering its failure.
+
+    Errors are shown here rather than inside the cached function, so a failed
+    request is neither cached nor replayed on later reruns.
+
+    Args:
+        fetch (Callable): The cached fetch function.
+        *args: Arguments passed to `fetch`.
+
+    Returns:
+        Any: The result of `fetch`, or None if the request failed.
+    """
+    try:
+        return fetch(*args)
+    except APIError as e:
+        show_api_error(e)
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _project_map(project_pairs):
+    """
+    Map project IDs to names, cached per list of projects.
+
+    Args:
+        project_pairs (tuple[tuple[int, str], ...]): (id, name) pairs of the projects.
+
+    Returns:
+        dict[int, str]: Project names keyed by ID.
+    """
+    return dict(project_pairs)
+
+
+def _render_pager(state_key, rows):
+    """
+    Render Previous/Next buttons for a paginated list.
+
+    The current page number (starting at 1) is kept in `st.session_state[state_key]`.
+    Pages are requested with `lookahead=1`, so the backend returns one row past
+    the page when another page exists; Next is enabled only then.
+
+    Args:
+        state_key (str): Session state key holding the page number.
+        rows (list | None): The rows returned for the current page, including
+            the lookahead row.
+
+    Returns:
+        None: Renders the buttons directly in the Streamlit app.
+    """
+    page = st.session_state.get(state_key, 1)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    col1.button(
+        "Previous", key=f"{state_key}_prev", disabled=page <= 1,
+        on_click=lambda: st.session_state.update({state_key: page - 1})
+    )
+    col2.caption(f"Page {page}")
+    col3.button(
+        "Next", key=f"{state_key}_next", disabled=len(rows or []) <= LIST_PAGE_SIZE,
+        on_click=lambda: st.session_state.update({state_key: page + 1})
+    )
+
+
+def _clear_cached_data():
+    """
+    Drop cached API reads after a change to projects, tasks, or time entries.
+
+    Returns:
+        None
+    """
+    _fetch_summary.clear()
+    _fetch_projects.clear()
+    _fetch_projects_by_id.clear()
+    _fetch_projects_page.clear()
+
+
 def display_dashboard(token):
     """
     Render the Streamlit dashboard for visualizing project time summaries.
 
     Displays an overview of projects with filters (current week, last week, 
-    current month, last month, or all time). Retrieves project summary data 
+    current month, last month, or all time), applied when the filter form is
+    submitted. Retrieves project summary data 
     from the API and displays it in both a table and a bar chart. Also provides 
     an option to export the data to Excel.
 
@@ -27,45 +236,26 @@ def display_dashboard(token):
     with col1:
         st.title("Overview")
 
+    with col2:
+        if st.button("Refresh"):
+            _fetch_summary.clear()
+
     with col3:
-        filter_options = ["Current Week", "Last Week", "Current Month", "Last Month", "All Time"]
-        selected_option = st.selectbox(
-            "Filter by:",
-            options=filter_options,
-            index=0,
-        )
+        # Inside a form, browsing options doesn't rerun the page until Apply
+        with st.form("dashboard_filter_form", border=False):
+            selected_option = st.selectbox(
+                "Filter by:",
+                options=tuple(DATE_RANGES),
+                index=0,
+                key='dashboard_filter',
+            )
+            st.form_submit_button("Apply")
     
     st.markdown("---")
 
-    start_date, end_date = None, None
-    today = date.today()
+    start_date, end_date = DATE_RANGES[selected_option](date.today())
 
-    if selected_option == "Current Week":
-        start_date = today - timedelta(days=today.weekday())
-        end_date = today
-    
-    elif selected_option == "Last Week":
-        start_of_this_week = today - timedelta(days=today.weekday())
-        start_of_last_week = start_of_this_week - timedelta(days=7)
-        end_of_last_week = start_of_last_week + timedelta(days=4)
-        start_date = start_of_last_week
-        end_date = end_of_last_week
-
-    elif selected_option == "Current Month":
-        start_date = today.replace(day=1)
-        end_date = today
-
-    elif selected_option == "Last Month":
-        first_day_of_current_month = today.replace(day=1)
-        last_day_of_last_month = first_day_of_current_month - timedelta(days=1)
-        start_date = last_day_of_last_month.replace(day=1)
-        end_date = last_day_of_last_month
-    
-    endpoint = 'projects/summary/'
-    if start_date and end_date:
-        endpoint += f'?start_date={start_date}&end_date={end_date}'
-    
-    summary_data = api_request('get', endpoint, token)
+    summary_data = _load(_fetch_summary, token, start_date, end_date)
 
     if not summary_data:
         st.info("No projects or time data to display for the selected period.")
@@ -81,46 +271,33 @@ def display_dashboard(token):
     else:
         st.subheader("Hours Summary per Project (All Time)")
 
-    # Display table without pyarrow using markdown
-    table_html = "<table style='width:100%; border-collapse: collapse;'>"
-    table_html += "<thead><tr style='background-color: #f0f2f6;'>"
-    table_html += "<th style='padding: 12px; text-align: left; border-bottom: 2px solid #ddd;'>Project</th>"
-    table_html += "<th style='padding: 12px; text-align: left; border-bottom: 2px solid #ddd;'>Total Hours</th>"
-    table_html += "</tr></thead><tbody>"
-
-    for _, row in df.iterrows():
-        table_html += "<tr style='border-bottom: 1px solid #ddd;'>"
-        table_html += f"<td style='padding: 12px;'>{row['name']}</td>"
-        table_html += f"<td style='padding: 12px;'>{row['total_hours']:.2f} h</td>"
-        table_html += "</tr>"
-
-    table_html += "</tbody></table>"
-    st.markdown(table_html, unsafe_allow_html=True)
+    # Sent to the browser as an Arrow table and laid out client-side
+    st.dataframe(
+        df[['name', 'total_hours']],
+        column_config={
+            'name': st.column_config.TextColumn("Project"),
+            'total_hours': st.column_config.NumberColumn("Total Hours", format="%.2f h"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
 
     st.divider()
     if not df_chart.empty:
-        # Display bar chart using HTML/CSS without pyarrow
-        max_hours = df_chart['total_hours'].max()
-        chart_html = "<div style='margin-top: 20px;'>"
-        chart_html += "<p style='font-weight: bold; margin-bottom: 10px;'>Total hours</p>"
-
-        for _, row in df_chart.iterrows():
-            percentage = (row['total_hours'] / max_hours * 100) if max_hours > 0 else 0
-            chart_html += f"<div style='margin-bottom: 10px;'>"
-            chart_html += f"<div style='font-size: 14px; margin-bottom: 5px;'>{row['name']}</div>"
-            chart_html += f"<div style='background-color: #f0f2f6; border-radius: 5px; overflow: hidden;'>"
-            chart_html += f"<div style='background-color: #ff4b4b; height: 30px; width: {percentage}%; display: flex; align-items: center; padding-left: 10px; color: white; font-weight: bold; min-width: 60px;'>"
-            chart_html += f"{row['total_hours']:.2f}h"
-            chart_html += "</div></div></div>"
-
-        chart_html += "</div>"
-        st.markdown(chart_html, unsafe_allow_html=True)
+        # Rendered client-side by Vega-Lite
+        st.markdown("**Total hours**")
+        top = df_chart.nlargest(CHART_MAX_PROJECTS, 'total_hours')
+        st.bar_chart(top.set_index('name')['total_hours'], horizontal=True)
+        rest = len(df_chart) - len(top)
+        if rest > 0:
+            st.caption(f"+{rest} more projects not shown")
     else:
         st.info("No projects have logged hours to display in the chart for the selected period.")
     st.divider()
     st.write("Click below to export the project hours for the selected period to Excel.")
     if st.button("Export"):
         export_to_excel(token, start_date, end_date)
+    show_excel_export(token, start_date, end_date)
 
 
 def display_profile_page(token):
@@ -169,8 +346,7 @@ def display_profile_page(token):
                 st.error("There was an error updating your profile.")
 
     if st.button("Back to Dashboard"):
-        st.session_state.page = 'dashboard'
-        st.rerun()
+        st.switch_page(_navigation_pages()['dashboard'])
 
 
 def display_manage_projects_page(token):
@@ -182,8 +358,10 @@ def display_manage_projects_page(token):
       - Edit an existing project (navigates to the edit project page).
       - Delete a project with confirmation.
 
-    Projects are cached in `st.session_state['project_list']` to reduce API calls, 
-    and the state is refreshed after project creation, editing, or deletion.
+    Projects are listed in pages of `LIST_PAGE_SIZE`, with the current page in
+    `st.session_state['projects_page']`. They are cached with `st.cache_data`
+    to reduce API calls, and the cache is cleared after project creation,
+    editing, or deletion.
 
     Args:
         token (str): Authentication token for the API request.
@@ -198,38 +376,64 @@ def display_manage_projects_page(token):
             del st.session_state['editing_project_id']
         st.rerun()
     st.markdown("---")
-    if 'project_list' not in st.session_state:
-        st.session_state['project_list'] = api_request('get', 'projects/', token)
-    projects = st.session_state.get('project_list')
+    page = st.session_state.setdefault('projects_page', 1)
+    projects = _load(_fetch_projects_page, token, page)
+    if not projects and page > 1:
+        st.session_state.projects_page = 1
+        st.rerun()
     if not projects:
         st.info("No projects yet. Click the button above to create your first one!")
     else:
-        for project in projects:
-            col1, col2, col3 = st.columns([3, 1, 1])
-            with col1:
-                st.subheader(project['name'])
-                st.caption(project.get('description') or 'No description')
-            with col2:
-                if st.button("Edit", key=f"edit_proj_{project['id']}"):
-                    st.session_state.page = 'edit_project'
-                    st.session_state.editing_project_id = project['id']
-                    st.rerun()
-            with col3:
-                if st.button("Delete", key=f"delete_proj_{project['id']}", type="secondary"):
-                    st.session_state.confirm_delete_project_id = project['id']
-            if st.session_state.get('confirm_delete_project_id') == project['id']:
-                with st.warning(f"Are you sure you want to delete project '{project['name']}'?"):
-                    c1, c2 = st.columns(2)
-                    if c1.button("Yes, Delete", key=f"confirm_del_proj_{project['id']}", type="primary"):
-                        if api_request('delete', f"projects/{project['id']}/", token):
-                            st.success("Project deleted.")
-                            del st.session_state.project_list
-                            del st.session_state.confirm_delete_project_id
-                            st.rerun()
-                    if c2.button("Cancel", key=f"cancel_del_proj_{project['id']}"):
-                        del st.session_state.confirm_delete_project_id
+        for project in projects[:LIST_PAGE_SIZE]:
+            _render_project_row(project, token)
+        _render_pager('projects_page', projects)
+
+
+@st.fragment
+def _render_project_row(project, token):
+    """
+    Render a single project card with its Edit and Delete actions.
+
+    The card is a collapsed expander titled with the project name; its
+    description and actions are shown when the user opens it.
+
+    Runs as a Streamlit fragment, so opening or cancelling the delete
+    confirmation reruns only this card. Navigating away or deleting the
+    project reruns the whole app.
+
+    Args:
+        project (dict): The project to render.
+        token (str): Authentication token for the API request.
+
+    Returns:
+        None: Renders the card directly in the Streamlit app.
+    """
+    project_id = project['id']
+    confirm_key = f"confirm_delete_project_{project_id}"
+    with st.expander(project['name']):
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            st.caption(project.get('description') or 'No description')
+        with col2:
+            if st.button("Edit", key=f"edit_proj_{project_id}"):
+                st.session_state.page = 'edit_project'
+                st.session_state.editing_project_id = project_id
+                st.rerun()
+        with col3:
+            if st.button("Delete", key=f"delete_proj_{project_id}", type="secondary"):
+                st.session_state[confirm_key] = True
+        if st.session_state.get(confirm_key):
+            with st.warning(f"Are you sure you want to delete project '{project['name']}'?"):
+                c1, c2 = st.columns(2)
+                if c1.button("Yes, Delete", key=f"confirm_del_proj_{project_id}", type="primary"):
+                    if api_request('delete', f"projects/{project_id}/", token):
+                        st.success("Project deleted.")
+                        _clear_cached_data()
+                        del st.session_state[confirm_key]
                         st.rerun()
-            st.divider()
+                if c2.button("Cancel", key=f"cancel_del_proj_{project_id}"):
+                    del st.session_state[confirm_key]
+                    st.rerun(scope="fragment")
 
 
 def display_project_form_page(token):
@@ -243,7 +447,7 @@ def display_project_form_page(token):
     On submission:
       - Validates required fields (project name).
       - Sends a POST request to create a project, or a PATCH request to update an existing one.
-      - Clears cached project data from session state and redirects back to 
+      - Clears cached project data and redirects back to 
         the "Manage Projects" page.
 
     Args:
@@ -256,10 +460,7 @@ def display_project_form_page(token):
     project_data = {}
     if editing_id:
         st.header("Edit Project")
-        if 'project_list' not in st.session_state:
-            st.session_state.project_list = api_request('get', 'projects/', token)
-        projects = st.session_state.get('project_list', [])
-        project_data = next((p for p in projects if p['id'] == editing_id), {})
+        project_data = (_load(_fetch_projects_by_id, token) or {}).get(editing_id, {})
     else:
         st.header("Create New Project")
     with st.form(key="project_form"):
@@ -275,8 +476,7 @@ def display_project_form_page(token):
                 method = 'patch' if editing_id else 'post'
                 if api_request(method, endpoint, token, json_data=payload):
                     st.success(f"Project {'updated' if editing_id else 'created'} successfully.")
-                    if 'project_list' in st.session_state:
-                        del st.session_state.project_list
+                    _clear_cached_data()
                     st.session_state.page = 'manage_projects'
                     if editing_id:
                         del st.session_state.editing_project_id
@@ -302,11 +502,11 @@ def display_manage_tasks_page(token):
       - Allows creating a new task for the selected project.
 
     State management:
-      - `st.session_state.project_list`: Cached list of projects.
       - `st.session_state.selected_project_id`: Currently selected project.
+      - `st.session_state.tasks_page_<id>`: Page of the project's task list shown.
       - `st.session_state.time_entry_task_id`: Task for which a time entry is being registered.
       - `st.session_state.editing_task_id`: Task being edited.
-      - `st.session_state.confirm_delete_task_id`: Task awaiting delete confirmation.
+      - `st.session_state.confirm_delete_task_<id>`: Set while a task awaits delete confirmation.
 
     Args:
         token (str): Authentication token for the API request.
@@ -315,57 +515,87 @@ def display_manage_tasks_page(token):
         None: Renders the task management UI directly in the Streamlit app.
     """
     st.header("Manage Tasks")
-    if 'project_list' not in st.session_state:
-        st.session_state.project_list = api_request('get', 'projects/', token)
-    projects = st.session_state.get('project_list')
+    projects = _load(_fetch_projects, token)
     if not projects:
         st.warning("Create a project first to be able to add tasks.")
         return
-    project_map = {p['id']: p['name'] for p in projects}
+    project_map = _project_map(tuple((p['id'], p['name']) for p in projects))
+    project_ids = tuple(project_map)
     if 'selected_project_id' not in st.session_state:
-        st.session_state.selected_project_id = list(project_map.keys())[0] if project_map else None
+        st.session_state.selected_project_id = project_ids[0] if project_ids else None
     selected_project_id = st.selectbox(
-        "Select a project", options=list(project_map.keys()),
+        "Select a project", options=project_ids,
         format_func=lambda pid: project_map.get(pid, "Unknown"), key='selected_project_id'
     )
     st.button("➕ New Task", on_click=lambda: st.session_state.update({
         'page': 'create_task', 'project_for_new_task': selected_project_id
     }))
     if selected_project_id:
-        tasks = api_request('get', f"projects/{selected_project_id}/tasks/", token)
+        page_key = f"tasks_page_{selected_project_id}"
+        page = st.session_state.setdefault(page_key, 1)
+        tasks = api_request(
+            'get',
+            f"projects/{selected_project_id}/tasks/?with_totals=1&page={page}&size={LIST_PAGE_SIZE}&lookahead=1",
+            token
+        )
+        if not tasks and page > 1:
+            st.session_state[page_key] = 1
+            st.rerun()
         if not tasks:
             st.info("No tasks for this project.")
-        for task in (tasks or []):
-            task_id = task['id']
-            response_data = api_request('get', f"tasks/{task_id}/time-entries/", token)
-            total_hours = response_data.get('total_hours', 0.0) if response_data else 0.0
-            formatted_total = parse_hours_string(total_hours)
-            st.subheader(task['name'])
-            st.caption(f"Total time: {formatted_total}")
-            st.caption(task.get('description') or 'No description')
-            col1, col2, col3 = st.columns([1, 1, 1])
-            if col1.button("Register Time", key=f"register_time_{task_id}"):
-                st.session_state.page = 'register_time'
-                st.session_state.time_entry_task_id = task_id
-                st.rerun()
-            if col2.button("Edit", key=f"edit_task_{task_id}"):
-                st.session_state.page = 'edit_task'
-                st.session_state.editing_task_id = task_id
-                st.rerun()
-            if col3.button("Delete", key=f"delete_task_{task_id}", type="secondary"):
-                st.session_state.confirm_delete_task_id = task_id
-            if st.session_state.get('confirm_delete_task_id') == task_id:
-                 with st.warning(f"Delete task '{task['name']}'? All time entries will be lost."):
-                    c1, c2 = st.columns(2)
-                    if c1.button("Yes, Delete", key=f"confirm_del_task_{task_id}", type="primary"):
-                        if api_request('delete', f"tasks/{task_id}/", token):
-                            st.success("Task deleted.")
-                            del st.session_state.confirm_delete_task_id
-                            st.rerun()
-                    if c2.button("Cancel", key=f"cancel_del_task_{task_id}"):
-                        del st.session_state.confirm_delete_task_id
+        else:
+            for task in tasks[:LIST_PAGE_SIZE]:
+                _render_task_row(task, token)
+            _render_pager(page_key, tasks)
+
+
+@st.fragment
+def _render_task_row(task, token):
+    """
+    Render a single task card with its total time and actions.
+
+    The card is a collapsed expander titled with the task name and total
+    time; its details and actions are shown when the user opens it.
+
+    Runs as a Streamlit fragment, so opening or cancelling the delete
+    confirmation reruns only this card. Navigating away or deleting the
+    task reruns the whole app.
+
+    Args:
+        task (dict): The task to render, including its `total_hours`.
+        token (str): Authentication token for the API request.
+
+    Returns:
+        None: Renders the card directly in the Streamlit app.
+    """
+    task_id = task['id']
+    confirm_key = f"confirm_delete_task_{task_id}"
+    formatted_total = parse_hours_string(task.get('total_hours'))
+    with st.expander(f"{task['name']} · {formatted_total}"):
+        st.caption(task.get('description') or 'No description')
+        col1, col2, col3 = st.columns([1, 1, 1])
+        if col1.button("Register Time", key=f"register_time_{task_id}"):
+            st.session_state.page = 'register_time'
+            st.session_state.time_entry_task_id = task_id
+            st.rerun()
+        if col2.button("Edit", key=f"edit_task_{task_id}"):
+            st.session_state.page = 'edit_task'
+            st.session_state.editing_task_id = task_id
+            st.rerun()
+        if col3.button("Delete", key=f"delete_task_{task_id}", type="secondary"):
+            st.session_state[confirm_key] = True
+        if st.session_state.get(confirm_key):
+            with st.warning(f"Delete task '{task['name']}'? All time entries will be lost."):
+                c1, c2 = st.columns(2)
+                if c1.button("Yes, Delete", key=f"confirm_del_task_{task_id}", type="primary"):
+                    if api_request('delete', f"tasks/{task_id}/", token):
+                        st.success("Task deleted.")
+                        _clear_cached_data()
+                        del st.session_state[confirm_key]
                         st.rerun()
-            st.divider()
+                if c2.button("Cancel", key=f"cancel_del_task_{task_id}"):
+                    del st.session_state[confirm_key]
+                    st.rerun(scope="fragment")
 
 
 def display_task_form_page(token):
@@ -389,7 +619,6 @@ def display_task_form_page(token):
     Session state keys used:
       - 'editing_task_id': The task currently being edited (if any).
       - 'project_for_new_task': The project ID where a new task will be created.
-      - 'selected_project_id': Used when fetching tasks for editing.
 
     Args:
         token (str): Authentication token for the API request.
@@ -402,9 +631,7 @@ def display_task_form_page(token):
     task_data = {}
     if editing_id:
         st.header("Edit Task")
-        project_id_for_fetch = st.session_state.get('selected_project_id')
-        tasks = api_request('get', f"projects/{project_id_for_fetch}/tasks/", token)
-        task_data = next((t for t in (tasks or []) if t['id'] == editing_id), {})
+        task_data = api_request('get', f"tasks/{editing_id}/", token) or {}
     else:
         st.header("Create New Task")
     if not project_id:
@@ -482,6 +709,7 @@ def display_time_entry_form(token):
                 response = api_request('post', f"tasks/{task_id}/time-entries/", token, json_data=payload)
                 if response is True or (isinstance(response, dict) and 'id' in response):
                     st.success("Time entry registered successfully!")
+                    _clear_cached_data()
                     del st.session_state['time_entry_task_id']
                     st.session_state.page = 'manage_tasks'
                     st.rerun()
@@ -497,12 +725,15 @@ def display_time_entry_form(token):
         st.info("No time entries yet for this task.")
     else:
         for entry in response_data.get('entries', []):
-            col1, col2, col3 = st.columns([2, 3, 1])
-            col1.markdown(f"**{parse_hours_string(entry.get('hours'))}** on `{entry.get('date')}`")
-            col2.markdown(entry.get('comment') or "*No comment*")
-            if col3.button("🗑️", key=f"delete_entry_{entry['id']}", help="Delete this entry"):
+            col1, col2 = st.columns([5, 1])
+            col1.markdown(
+                f"**{parse_hours_string(entry.get('hours'))}** on `{entry.get('date')}` — "
+                f"{entry.get('comment') or '*No comment*'}"
+            )
+            if col2.button("🗑️", key=f"delete_entry_{entry['id']}", help="Delete this entry"):
                 if api_request('delete', f"time-entries/{entry['id']}/", token):
                     st.success("Entry deleted.")
+                    _clear_cached_data()
                     st.rerun()
     st.divider()
     if st.button("Back to All Tasks"):
@@ -511,23 +742,113 @@ def display_time_entry_form(token):
         st.rerun()
 
 
+def _enter_section(section):
+    """
+    Reset the section's sub-page when arriving from another navigation section.
+
+    Forms (e.g. editing a project or registering time) are sub-pages of a
+    section tracked in `st.session_state['page']`; switching sections from
+    the sidebar returns to the section's main view, as before.
+
+    Args:
+        section (str): Page identifier of the section's main view.
+
+    Returns:
+        str: The current page identifier within the section.
+    """
+    if st.session_state.get('section') != section:
+        st.session_state.section = section
+        st.session_state.page = section
+    return st.session_state.page
+
+
+def _dashboard_section():
+    """
+    Navigation page for the dashboard.
+
+    Returns:
+        None: Renders the dashboard directly in the Streamlit app.
+    """
+    _enter_section('dashboard')
+    display_dashboard(st.session_state.token)
+
+
+def _projects_section():
+    """
+    Navigation page for project management and the project form.
+
+    Returns:
+        None: Renders the current project page directly in the Streamlit app.
+    """
+    page = _enter_section('manage_projects')
+    if page in ['create_project', 'edit_project']:
+        display_project_form_page(st.session_state.token)
+    else:
+        display_manage_projects_page(st.session_state.token)
+
+
+def _tasks_section():
+    """
+    Navigation page for task management, the task form, and time entries.
+
+    Returns:
+        None: Renders the current task page directly in the Streamlit app.
+    """
+    page = _enter_section('manage_tasks')
+    if page in ['create_task', 'edit_task']:
+        display_task_form_page(st.session_state.token)
+    elif page == 'register_time':
+        display_time_entry_form(st.session_state.token)
+    else:
+        display_manage_tasks_page(st.session_state.token)
+
+
+def _profile_section():
+    """
+    Navigation page for the user's profile.
+
+    Returns:
+        None: Renders the profile page directly in the Streamlit app.
+    """
+    _enter_section('profile')
+    display_profile_page(st.session_state.token)
+
+
+def _navigation_pages():
+    """
+    Build the pages listed in the sidebar navigation.
+
+    Returns:
+        dict[str, st.Page]: The pages keyed by section identifier.
+    """
+    return {
+        'dashboard': st.Page(_dashboard_section, title="Dashboard", url_path="dashboard", default=True),
+        'manage_projects': st.Page(_projects_section, title="Manage Projects", url_path="projects"),
+        'manage_tasks': st.Page(_tasks_section, title="Manage Tasks", url_path="tasks"),
+        'profile': st.Page(_profile_section, title="Profile", url_path="profile"),
+    }
+
+
 def main_page():
     """
     Render the main Streamlit application page with navigation.
 
     Handles:
       - Checking if the user is logged in (requires a token in session state).
-      - Sidebar navigation between different sections of the app:
+      - Sidebar navigation between different sections of the app through
+        `st.navigation`, which runs only the selected page:
           - Dashboard
           - Manage Projects
           - Manage Tasks
           - Profile
-          - Logout (clears session state and reruns)
-      - Routes to the correct page renderer based on `st.session_state['page']`.
+      - Logout (clears session state and reruns).
+
+    Within a section, forms are routed by `st.session_state['page']`.
 
     Session state keys used:
       - 'token': Authentication token (required for accessing app content).
-      - 'page': Current page identifier (defaults to 'dashboard').
+      - 'section': Navigation section currently shown.
+      - 'page': Current page identifier within the section.
 
     Returns:
         None: Renders the appropriate page directly in the Streamlit app.
@@ -536,45 +857,11 @@ def main_page():
     if not token:
         st.warning("Please log in.")
         return
-    if 'page' not in st.session_state:
-        st.session_state.page = 'dashboard'
+    navigation = st.navigation(list(_navigation_pages().values()))
     with st.sidebar:
-        st.header("Navigation")
-        st.divider()
-        if st.button("Dashboard"):
-            st.session_state.page = 'dashboard'
-            st.rerun()
-        if st.button("Manage Projects"):
-            st.session_state.page = 'manage_projects'
-            st.rerun()
-        if st.button("Manage Tasks"):
-            st.session_state.page = 'manage_tasks'
-            st.rerun()
-        if st.button("Profile"):
-            st.session_state.page = "profile"
-            st.rerun()
         st.divider()
         if st.button("Logout"):
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
             st.rerun()
-
-    page = st.session_state.get('page')
-    
-    if page == 'dashboard':
-        display_dashboard(token)
-    elif page == 'profile':
-        display_profile_page(token)
-    elif page == 'manage_projects':
-        display_manage_projects_page(token)
-    elif page in ['create_project', 'edit_project']:
-        display_project_form_page(token)
-    elif page == 'manage_tasks':
-        display_manage_tasks_page(token)
-    elif page in ['create_task', 'edit_task']:
-        display_task_form_page(token)
-    elif page == 'register_time':
-        display_time_entry_form(token)
-    else:
-        st.session_state.page = 'dashboard'
-        st.rerun()
+    navigation.run()